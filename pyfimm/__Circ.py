@@ -431,8 +431,9 @@ class Circ(Node):
             wgString += nodestr + ".setmaterbase(" + matDB + ")  \n" 
         
         layerN = 1
+        dbg = DEBUG.value
         for lyr in obj.layers:
-            if DEBUG(): print "Layer ", layerN, "; radius:", lyr.thickness
+            if dbg: print "Layer ", layerN, "; radius:", lyr.thickness
             
             if layerN > 1: wgString += nodestr + ".insertlayer("+str(layerN)+")  \n"
             wgString += nodestr + ".layers[{"+str(layerN)+"}].size = "+str(lyr.thickness)+"\n"
@@ -573,13 +574,13 @@ class Circ(Node):
             '''Default to -1e50'''
             wgString += nodestr + ".mlp.evend={-1e+050}"+"\n"
         else:
-            wgStrint += nodestr + ".mlp.evend={"+str(get_min_EV())+"}"+"\n"
+            wgString += nodestr + ".mlp.evend={"+str(get_min_EV())+"}"+"\n"
         
         if get_max_EV() is None:
             '''Default to +1e50'''
             wgString += nodestr + ".mlp.evstart={1e+050}"+"\n"
         else:
-            wgStrint += nodestr + ".mlp.evend={"+str(get_max_EV())+"}"+"\n"
+            wgString += nodestr + ".mlp.evstart={"+str(get_max_EV())+"}"+"\n"
 
         if get_RIX_tol() is None:
             rix_svp = 0.010000
@@ -906,8 +907,7 @@ def set_circ_boundary(type):
     type : string { 'electric wall' | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' }
     '''
     possibleArgs = ['electric wall' , 'metal', 'magnetic wall' , 'periodic' , 'transparent' , 'impedance']
-    exists = len(   np.where(  np.array( type ) == np.array( possibleArgs)  )[0]   )
-    if not exists: raise ValueError("Allowed arguments are: 'electric wall' (aka. 'metal') | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' ")
+    if str(type).lower() not in possibleArgs: raise ValueError("Allowed arguments are: 'electric wall' (aka. 'metal') | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' ")
     type=type.lower()
     if type == 'metal':
         type = 'electric wall' 
@@ -286,14 +286,21 @@ class Node(object):
         
         warn : { True | False }, optional
             Print warning?  Defaults to False, but still prints if the global pyFIMM.set_WARN() is True, which it is by default.   Use set_WARN()/unset_WARN() to alter.
+        
+        Returns
+        -------
+        The number of subnodes under `nodestring` after the check (ie. after any overwritten node was deleted), so callers needn't query `numsubnodes()` again.
             '''
         ## Check if top-level node name conflicts with one already in use:
         #AppSubnodes = fimm.Exec("app.subnodes")        # The pdPythonLib didn't properly handle the case where there is only one list entry to return.  Although we could now use this function, instead we manually get each subnode's name:
         N_nodes = int(  fimm.Exec(nodestring+".numsubnodes()")  )
         SNnames = []    #subnode names
-        for i in range(N_nodes):
-            SNnames.append(  fimm.Exec(nodestring+r".subnodes["+str(i+1)+"].nodename()").strip()[:-2]  )   
-            # trim whitespace via string's strip(), strip the two EOL chars '\n\x00' from end via indexing [:-2]
+        if N_nodes > 0:
+            # fetch all the names in one round-trip:
+            names = fimm.Exec(  "\n".join( [nodestring+".subnodes["+str(i+1)+"].nodename()" for i in range(N_nodes)] )  )
+            if N_nodes == 1: names = [names]    # a single value is not returned as a list
+            # trim whitespace & the EOL chars '\n\x00' from each name:
+            SNnames = [ str(nm).replace('\x00','').strip() for nm in names ]
         # check if node name is in the node list:
         sameprojname = np.where( np.array(SNnames) == np.array([self.name]) )[0]
         #if DEBUG(): print "Node._checkNodeName(): [sameprojname] = ", sameprojname, "\nSNnames= ", SNnames
@@ -304,6 +311,7 @@ class Node(object):
                 if warn or WARN(): print "Overwriting existing Node #" + str(sameprojname) + ", `" + SNnames[sameprojname] + "`."
                 sameprojname = sameprojname[0]+1
                 fimm.Exec(nodestring+".subnodes["+str(sameprojname)+"].delete()")
+                N_nodes -= 1
             else: 
                 '''change the name of this new node'''
                 if warn or WARN(): print "WARNING: Node name `" + self.name + "` already exists;"
@@ -315,6 +323,9 @@ class Node(object):
             pass
         #end if(self.name already exists aka. len(sameprojname) )
         
+        return N_nodes
+    #end _checkNodeName()
+        
     
     def set_parent(self, parent_node):
         self.parent = parent_node
@@ -730,6 +730,8 @@ class Device(Node):
         `cont` is the handle to the contourf() plot (filled-contour).
         
         '''
+        import matplotlib.pyplot as plt     # imported here so that `import pyfimm` doesn't load matplotlib
+        cm_hotcold = get_cm_hotcold()
         
         side = side.lower().strip()
         if side == 'left' or side == 'l' or side == 'lhs':
@@ -1204,6 +1206,7 @@ class Device(Node):
             >>> DeviceObj.mode( 0 ).plot('Ex', refractive_index=True)  # plot Ex Total of Mode 0, with Refractive Index profile plotted on separate axis
             >>> fig, axis, line, leg = DeviceObj.mode( 0 ).plot('Ex', return_handles=True)  # plot Ex Total of Mode 0 and return matplotlib handles to the figure's elements
         '''
+        import matplotlib.pyplot as plt     # imported here so that `import pyfimm` doesn't load matplotlib
         
         RIplot = refractive_index
         
@@ -1355,8 +1358,6 @@ class Device(Node):
         #nodestring = parent.nodestring
         check_node_name(self.name, self.parent.nodestring, overwrite=overwrite, warn=warn)
         
-        self.jointpos = []    # eltlist[] position of simple joints
-        self.elementpos = []  # eltlist[] position of each waveguide element
         #N_nodes = fimm.Exec("app.subnodes["+str(self.parent.num)+"].numsubnodes()")
         N_nodes = fimm.Exec( self.parent.nodestring+".numsubnodes()")
         node_num = int(N_nodes)+1
@@ -1387,7 +1388,15 @@ class Device(Node):
         num2 = 1        # 0 = use Device parameters, 1 = use WG parameters
         jtype_warning = True    # warning flag for joint-type override
         
-        for ii,el in enumerate(self.elements):
+        # local aliases for the loop below, to avoid repeated attribute lookups:
+        nodestring = self.nodestring
+        name = self.name
+        lengths = self.lengths
+        elements = self.elements
+        last_ii = len(elements)-1
+        dev_jtype = self.get_joint_type(True)     # Device-level joint-type, `None` if unset
+        
+        for ii,el in enumerate(elements):
             elnum = elnum+1
             
 
@@ -1397,16 +1406,14 @@ class Device(Node):
                 if DEBUG(): print "Device.buildNode():  type = Taper"
                 fpString +=   self.__BuildTaperNode( el, elnum )
                 el.built = True
-                self.elementpos.append(elnum)
                 # Set the WG length:
-                fpString += self.nodestring + ".cdev.eltlist["+str(elnum)+"].length="+str(self.lengths[ii]) + "  \n"
+                fpString += nodestring + ".cdev.eltlist["+str(elnum)+"].length="+str(lengths[ii]) + "  \n"
             
             elif isinstance( el, Lens ):
                 '''The Lens object will be a Waveguide Lens element.'''
                 if DEBUG(): print "Device.buildNode():  type = Lens"
                 fpString +=   self.__BuildLensElement( el, elnum )
                 el.built = True
-                self.elementpos.append(elnum)
                 
             else:
                 '''For all waveguide elements, add the previously built WG Node to this Device:'''
@@ -1414,53 +1421,56 @@ class Device(Node):
                 if el.built != True:
                     '''If the WG was not previously built, tell it to build itself.  '''
                     try:
-                        print self.name + ".buildNode(): Attempting to build the unbuilt element:", el.name
+                        print name + ".buildNode(): Attempting to build the unbuilt element:", el.name
                         el.buildNode()  # tell the element to build itself
                     except:
                         try:
                             elname = el.name
                         except AttributeError:
                             elname=el.__repr__()
-                        errstr = "Error while building Device Node `"+self.name+"`: \nA constituent element `" +elname+ "` could not be built. Perhaps try building all waveguide nodes via `WGobj.buildNode()` before building the Device."
+                        errstr = "Error while building Device Node `"+name+"`: \nA constituent element `" +elname+ "` could not be built. Perhaps try building all waveguide nodes via `WGobj.buildNode()` before building the Device."
                         raise RuntimeError(errstr)
                 
                 if DEBUG(): print "Device.buildNode(): %i: type(el)=%s, name=%s"%(ii, str(type(el)), el.name)
                 
                 # Add the waveguide node into this Device:
                 #   (assumes WG Node is in the root-level of this FimmWave Project)
-                fpString += self.nodestring + ".cdev.newwgsect("+str(elnum)+","+"../"+el.name+","+str(num2)+")  \n"      
-                self.elementpos.append(elnum)   # save the element number (elt) of this WG element.
+                fpString += nodestring + ".cdev.newwgsect("+str(elnum)+","+"../"+el.name+","+str(num2)+")  \n"      
                     
                 # Set the WG length:
-                fpString += self.nodestring + ".cdev.eltlist["+str(elnum)+"].length="+str(self.lengths[ii]) + "  \n"
+                fpString += nodestring + ".cdev.eltlist["+str(elnum)+"].length="+str(lengths[ii]) + "  \n"
 
             #end if(is Taper/Lens/etc.)
             
             
 
-            if ii != len(self.elements)-1:
+            if ii != last_ii:
                 '''Add a simple joint between waveguides.'''
                 elnum = elnum+1
-                fpString += self.nodestring + ".cdev.newsjoint("+str(elnum)+")"+"\n"
+                fpString += nodestring + ".cdev.newsjoint("+str(elnum)+")"+"\n"
                 
                 
                 # Set the Joint method : 0="complete"  1=normal Fresnel, 2=oblique Fresnel, 3=special complete
                 # get joint types:
-                if self.get_joint_type() == None:
+                if dev_jtype == None:
                     jtype = el.get_joint_type(True)     # Element-level joint-type
                 else:
-                    jtype = self.get_joint_type(True)   # Device-level joint-type
+                    jtype = dev_jtype   # Device-level joint-type
                     if jtype != el.get_joint_type(True) and jtype_warning:
-                        print "Warning: " + self.name + ".buildNode(): settings for Device joint type do not match those of element #" + str(elnum-1) + " (of type " + str(type(el)) + "). The Device setting will override the element's setting.  This warning will be suppressed for the rest of the build."
+                        print "Warning: " + name + ".buildNode(): settings for Device joint type do not match those of element #" + str(elnum-1) + " (of type " + str(type(el)) + "). The Device setting will override the element's setting.  This warning will be suppressed for the rest of the build."
                         jtype_warning = False   # suppress this warning from now on
                 #end if(joint type)
                     
-                fpString += self.nodestring + ".cdev.eltlist["+str(elnum)+"].method="+str( jtype )+"\n"
-                self.jointpos.append(elnum)   # add position of this joint to the joints list
+                fpString += nodestring + ".cdev.eltlist["+str(elnum)+"].method="+str( jtype )+"\n"
 
             
         #end for(ii,elements)
         
+        # Elements & joints alternate in the eltlist[], so their positions are known without tracking them in the loop:
+        n_el = len(elements)
+        self.elementpos = list(range(1, 2*n_el, 2))  # eltlist[] position of each waveguide element
+        self.jointpos = list(range(2, 2*n_el, 2))    # eltlist[] position of simple joints
+        
         # Set wavelength:
         fpString += self.nodestring + ".lambda = " + str( self.get_wavelength() ) + "   \n"
         
@@ -1509,87 +1519,91 @@ class Device(Node):
         node_num = self.num
         prj_num = self.parent.num
         node_name = self.name
+        # bind the Taper's attributes & the element's node string once:
+        lhs, rhs, length, method = el.lhs, el.rhs, el.length, el.method
+        eltstr = self.nodestring + ".cdev.eltlist[{"+str(elnum)+"}]"
+        
         fpString=""
-        fpString += self.nodestring + ".cdev.newtaper({"+str(2*ii+1)+"},../"+str(el.lhs)+",../"+str(el.rhs)+")"+"\n"
-        fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].length={"+str(el.length)+"}"+"\n"
-        fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].shape_type=0"+"\n"
-        fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].itpfunc.string=\""+str()+"\""+"\n"
+        fpString += self.nodestring + ".cdev.newtaper({"+str(elnum)+"},../"+str(lhs)+",../"+str(rhs)+")"+"\n"
+        fpString += eltstr + ".length={"+str(length)+"}"+"\n"
+        fpString += eltstr + ".shape_type=0"+"\n"
+        fpString += eltstr + ".itpfunc.string=\""+str()+"\""+"\n"
 
-        if el.method == 'full':
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].int_method=0"+"\n"
+        if method == 'full':
+            fpString += eltstr + ".int_method=0"+"\n"
         else:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].int_method=1"+"\n"
+            fpString += eltstr + ".int_method=1"+"\n"
 
         if  mode_solver() == 'vectorial FDM real' or mode_solver() == 'semivecTE FDM real' or mode_solver() == 'semivecTM FDM real' or mode_solver() == 'vectorial FDM complex' or mode_solver() == 'semivecTE FDM complex' or mode_solver() == 'semivecTM FDM complex':
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].enableevscan=0"+"\n"
+            fpString += eltstr + ".enableevscan=0"+"\n"
         else:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].enableevscan=1"+"\n"
+            fpString += eltstr + ".enableevscan=1"+"\n"
 
-        fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.autorun=1"+"\n"
-        fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.speed=0"+"\n"
+        fpString += eltstr + ".mlp.autorun=1"+"\n"
+        fpString += eltstr + ".mlp.speed=0"+"\n"
 
         if horizontal_symmetry() is None:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.hsymmetry=0"+"\n"
+            fpString += eltstr + ".svp.hsymmetry=0"+"\n"
         else:
             if horizontal_symmetry() == 'none':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.hsymmetry=0"+"\n"
+                fpString += eltstr + ".svp.hsymmetry=0"+"\n"
             elif horizontal_symmetry() == 'ExSymm':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.hsymmetry=1"+"\n"
+                fpString += eltstr + ".svp.hsymmetry=1"+"\n"
             elif horizontal_symmetry() == 'EySymm':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.hsymmetry=2"+"\n"
+                fpString += eltstr + ".svp.hsymmetry=2"+"\n"
             else:
-                print self.name + '.buildNode(): Invalid horizontal_symmetry. Please use: none, ExSymm, or EySymm'
+                print node_name + '.buildNode(): Invalid horizontal_symmetry. Please use: none, ExSymm, or EySymm'
 
         if vertical_symmetry() is None:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.vsymmetry=0"+"\n"
+            fpString += eltstr + ".svp.vsymmetry=0"+"\n"
         else:
             if vertical_symmetry() == 'none':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.vsymmetry=0"+"\n"
+                fpString += eltstr + ".svp.vsymmetry=0"+"\n"
             elif vertical_symmetry() == 'ExSymm':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.vsymmetry=1"+"\n"
+                fpString += eltstr + ".svp.vsymmetry=1"+"\n"
             elif vertical_symmetry() == 'EySymm':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.vsymmetry=2"+"\n"
+                fpString += eltstr + ".svp.vsymmetry=2"+"\n"
             else:
-                print self.name + '.buildNode(): Invalid horizontal_symmetry. Please use: none, ExSymm, or EySymm'
+                print node_name + '.buildNode(): Invalid horizontal_symmetry. Please use: none, ExSymm, or EySymm'
         
         if N() is None:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.maxnmodes={10}"+"\n"
+            fpString += eltstr + ".mlp.maxnmodes={10}"+"\n"
         else:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.maxnmodes={"+str(N())+"}"+"\n"
+            fpString += eltstr + ".mlp.maxnmodes={"+str(N())+"}"+"\n"
 
         if NX() is None:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.nx={60}"+"\n"
+            fpString += eltstr + ".mlp.nx={60}"+"\n"
             nx_svp = 60
         else:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.nx={"+str(NX())+"}"+"\n"
+            fpString += eltstr + ".mlp.nx={"+str(NX())+"}"+"\n"
             nx_svp = NX()
 
         if NY() is None:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.ny={60}"+"\n"
+            fpString += eltstr + ".mlp.ny={60}"+"\n"
             ny_svp = 60
         else:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.ny={"+str(NY())+"}"+"\n"
+            fpString += eltstr + ".mlp.ny={"+str(NY())+"}"+"\n"
             ny_svp = NY()
 
         if min_TE_frac() is None:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.mintefrac={0}"+"\n"
+            fpString += eltstr + ".mlp.mintefrac={0}"+"\n"
         else:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.mintefrac={"+str(min_TE_frac())+"}"+"\n"
+            fpString += eltstr + ".mlp.mintefrac={"+str(min_TE_frac())+"}"+"\n"
         
         if max_TE_frac() is None:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.maxtefrac={100}"+"\n"
+            fpString += eltstr + ".mlp.maxtefrac={100}"+"\n"
         else:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.maxtefrac={"+str(max_TE_frac())+"}"+"\n"
+            fpString += eltstr + ".mlp.maxtefrac={"+str(max_TE_frac())+"}"+"\n"
         
         if min_EV() is None:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.evend={-1e+050}"+"\n"
+            fpString += eltstr + ".mlp.evend={-1e+050}"+"\n"
         else:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.evend={"+str(min_EV())+"}"+"\n"
+            fpString += eltstr + ".mlp.evend={"+str(min_EV())+"}"+"\n"
         
         if max_EV() is None:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.evstart={1e+050}"+"\n"
+            fpString += eltstr + ".mlp.evstart={1e+050}"+"\n"
         else:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].mlp.evend={"+str(max_EV())+"}"+"\n"
+            fpString += eltstr + ".mlp.evstart={"+str(max_EV())+"}"+"\n"
 
         if RIX_tol() is None:
             rix_svp = 0.010000
@@ -1607,47 +1621,47 @@ class Device(Node):
             mmatch_svp = mmatch()
 
         if mode_solver() is None:
-            fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.solvid=71"+"\n"
-            solverString = self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
+            fpString += eltstr + ".svp.solvid=71"+"\n"
+            solverString = eltstr + ".svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
         else:
             if mode_solver() == 'vectorial FDM real':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.solvid=71"+"\n"
-                solverString = self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
+                fpString += eltstr + ".svp.solvid=71"+"\n"
+                solverString = eltstr + ".svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
             elif mode_solver() == 'semivecTE FDM real':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.solvid=23"+"\n"
-                solverString = self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
+                fpString += eltstr + ".svp.solvid=23"+"\n"
+                solverString = eltstr + ".svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
             elif mode_solver() == 'semivecTM FDM real':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.solvid=39"+"\n"
-                solverString = self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
+                fpString += eltstr + ".svp.solvid=39"+"\n"
+                solverString = eltstr + ".svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
             elif mode_solver() == 'vectorial FDM complex':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.solvid=79"+"\n"
-                solverString = self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
+                fpString += eltstr + ".svp.solvid=79"+"\n"
+                solverString = eltstr + ".svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
             elif mode_solver() == 'semivecTE FDM complex':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.solvid=31"+"\n"
-                solverString = self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
+                fpString += eltstr + ".svp.solvid=31"+"\n"
+                solverString = eltstr + ".svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
             elif mode_solver() == 'semivecTM FDM complex':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.solvid=47"+"\n"
-                solverString = self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
+                fpString += eltstr + ".svp.solvid=47"+"\n"
+                solverString = eltstr + ".svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
             elif mode_solver() == 'vectorial FMM real':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.solvid=65"+"\n"
-                solverString = self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
+                fpString += eltstr + ".svp.solvid=65"+"\n"
+                solverString = eltstr + ".svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
             elif mode_solver() == 'semivecTE FMM real':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.solvid=17"+"\n"
-                solverString = self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
+                fpString += eltstr + ".svp.solvid=17"+"\n"
+                solverString = eltstr + ".svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
             elif mode_solver() == 'semivecTM FMM real':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.solvid=33"+"\n"
-                solverString = self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
+                fpString += eltstr + ".svp.solvid=33"+"\n"
+                solverString = eltstr + ".svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
             elif mode_solver() == 'vectorial FMM complex':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.solvid=73"+"\n"
-                solverString = self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
+                fpString += eltstr + ".svp.solvid=73"+"\n"
+                solverString = eltstr + ".svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
             elif mode_solver() == 'semivecTE FMM complex':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.solvid=25"+"\n"
-                solverString = self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
+                fpString += eltstr + ".svp.solvid=25"+"\n"
+                solverString = eltstr + ".svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
             elif mode_solver() == 'semivecTM FMM complex':
-                fpString += self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.solvid=41"+"\n"
-                solverString = self.nodestring + ".cdev.eltlist[{"+str(2*ii+1)+"}].svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
+                fpString += eltstr + ".svp.solvid=41"+"\n"
+                solverString = eltstr + ".svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
             else:
-                print self.name + '.buildNode(): Invalid Mode Solver. Please use: '
+                print node_name + '.buildNode(): Invalid Mode Solver. Please use: '
                 print '    vectorial FDM real, semivecTE FDM real,semivecTM FDM real, '
                 print '    vectorial FDM complex, semivecTE FDM complex , semivecTM FDM complex, '
                 print '    vectorial FMM real, semivecTE FMM real, semivecTM FMM real, '
@@ -2,25 +2,102 @@
 
 
 from __globals import *     # import global vars & FimmWave connection object
-# also contains AMF_FolderStr(), DEBUG(), numpy as np & pyplot as plt
+# also contains AMF_FolderStr(), DEBUG() & numpy as np
 
 
-from pylab import cm    # color maps
 import math
-import os  # for filepath manipulations (os.path.join/os.mkdir/os.path.isdir)
+import os  # for filepath manipulations (os.path.join/os.makedirs/os.path.isdir/os.remove)
+from cStringIO import StringIO  # file-like string buffer
+from multiprocessing.pool import ThreadPool     # for reading multiple AMF files at once
+
+pd = None               # pandas, imported by _parse_amf() on first use
+_pd_checked = False     # whether the pandas import has been tried yet
 
 from __pyfimm import get_N, get_wavelength
 
 
+# FimmWave's integer codes for each field component, as used by `getfieldarray()`:
+_FIELD_CODES = {'ex':'1', 'ey':'2', 'ez':'3', 'hx':'4', 'hy':'5', 'hz':'6', 'i':'7'}
+
+# Order of the field components in an AMF file, each block being (nx+2) lines long - see Mode.plot():
+_FIELD_OFFSETS = {'ex':0, 'ey':1, 'ez':2, 'hx':3, 'hy':4, 'hz':5}
+
+_FOUR_PI = 4.0 * math.pi
+
+
 #from pylab import *     # no more global namespace imports
 #from numpy import *
 #import pylab as pl     # use numpy instead (imported as np)
-#import matplotlib.pyplot as plt    # now imported in Globals.py
+#import matplotlib.pyplot as plt    # now imported in plot(), only when needed
 #import numpy as np
 
 #AMF_FileStr = 'pyFIMM_temp'
 
 
+def _parse_amf(amf_file, field_cpt, keep=False):
+    '''Read one field component from an AMF file written by FimmWave's `writeamf()`, for Mode.plot().
+    The file is deleted afterwards, unless `keep=True`.
+    
+    Returns
+    -------
+    xy, field_real
+        The window extents [xmin, xmax, ymin, ymax] and the real part of the field component, as an [(nx+1) x (ny+1)] float32 array.
+    '''
+    fin = open(amf_file, "rb", 1<<20)    # 1 MB read buffer, for large AMF files
+    header = [fin.readline() for i in range(9)]   # File Header
+    body = fin.read()       # all the field data, as one string
+    fin.close()
+    if not keep: os.remove(amf_file)   # temp file no longer needed
+    
+    nxy_data = header[1]
+    xy_data = header[2]
+    slvr_data = header[6]
+    
+    # Parse the header lines, without the trailing `//` comments:
+    nx, ny = [int(v) for v in nxy_data.split('//')[0].split()[:2]]
+    xy = [float(v) for v in xy_data.split('//')[0].split()[:4]]
+    iscomplex = int( slvr_data.split('//')[0].split()[0] )
+    
+    try:
+        k = _FIELD_OFFSETS[field_cpt]
+    except KeyError:
+        ErrStr = 'Invalid Field component requested: ' + str(field_cpt)
+        raise ValueError(ErrStr)
+    # only split the lines up to the end of the requested component, the rest stays one string:
+    data_list = body.split('\n', (k+1)*(nx+2))
+    del body
+    data = data_list[k*(nx+2)+1:(k+1)*(nx+2)]   # any trailing '\r' is whitespace to the parsers
+    
+    del data_list
+    
+    # Get Data - (nx+1) rows of (ny+1) values, with (real, imag) pairs interleaved if complex.
+    # Only used for plotting, so single precision is plenty:
+    ncols = (ny+1) * (2 if iscomplex == 1 else 1)
+    global pd, _pd_checked
+    if not _pd_checked:
+        # optional - faster C parser for the field data, imported here so that `import pyfimm` doesn't load pandas:
+        try:
+            import pandas
+            pd = pandas
+        except ImportError:
+            pd = None
+        _pd_checked = True
+    if pd is not None:
+        field = pd.read_csv( StringIO("\n".join(data)), sep=r'\s+', header=None, engine='c', dtype=np.float32 ).values
+    else:
+        field = np.fromstring( "\n".join(data), sep=' ', dtype=np.float32, count=(nx+1)*ncols )
+    field = field.reshape( nx+1, ncols )
+    if iscomplex == 1:
+        field_real = field[:, 0::2]
+        #field_imag = field[:, 1::2]
+    else:
+        field_real = field
+    
+    return xy, field_real
+#end _parse_amf()
+
+
+
 class Mode:
     '''Mode( WGobj, modenum, modestring )
     
@@ -153,11 +230,21 @@ class Mode:
                 raise ValueError(ErrStr)
         #end if(num)
         
-        if np.max(self.list_num) > get_N():
-            ErrStr = "Mode: Requested Mode number %i is too high: `set_N()` currently only calculates %i modes (which start at Mode #0)." %(np.max(self.modenum), get_N() )
+        if max(self.list_num) > get_N():
+            ErrStr = "Mode: Requested Mode number %i is too high: `set_N()` currently only calculates %i modes (which start at Mode #0)." %(max(self.modenum), get_N() )
             raise ValueError(ErrStr)
     
         if DEBUG(): print self.obj.name + ".Mode: modenum = ", self.modenum, ";  list_num = ", self.list_num
+        
+        # FimmWave string to access each mode in `list_num`, including trailing `.`:
+        self._prefixes = [self.modeString + "list[{%i}]."%(num) for num in self.list_num]
+        
+        # Values already fetched from FimmWave, so repeated `get_*()` calls don't re-query them - see `invalidate()`:
+        self._cache = {}        # {(attribute, list_num): value}
+        self._modedata_level = {}   # {list_num: highest `modedata.update(level)` already run}
+        self._wl = None             # wavelength, see _attenuation_factor()
+        self._attn_factor = None    # see _attenuation_factor()
+        self._field_cache = {}      # {(list_num, component code, pml): field array}, see get_field()
     
     
     #end __init__()
@@ -165,32 +252,94 @@ class Mode:
     
     def __str__(self):
         '''What to display if the Waveguide is `print`ed.'''
+        # calc. all the modedata (for n_g, confinement etc.), then fetch every value in a single FimmWave call:
+        self._update_modedata(1)
+        neff, n_g, tefrac, gammaE, a_eff, kz = self._exec_batch( ['neff()', 'modedata.neffg', 'modedata.tefrac', 'modedata.gammaE', 'modedata.a_eff', 'beta()'] )
+        attn_factor = self._attenuation_factor()
+        
         string = ""
         if self.obj.name: string += "Waveguide Name: '"+self.obj.name+"'\n"  
         for n, num in enumerate(self.list_num):
             string += "Mode (%i):\n"%num
-            string += "\tModal Index (n_eff) = %0.5f \n"%(self.get_n_eff(as_list=True)[n].real)
-            string += "\tGroup Index (n_g) = %0.5f \n"%(self.get_n_g(as_list=True)[n].real)
-            string += "\tPercent of the mode in TE direction = %0.1f %% \n"%(self.get_percent_TE(as_list=True)[n])
-            string += "\tConfinement Factor (overlap with cfseg) = %0.1f \n"%(self.get_confinement(as_list=True)[n])
-            string += "\tEffective Area = %0.3f  um^2 \n"%(self.get_effective_area(as_list=True)[n])
-            string += "\tAttenuation = %0.3f  1/cm \n"%(self.get_attenuation(as_list=True)[n])
-            string += "\tPropagation Constant = %0.3f + j*%0.3f  1/um \n"%(self.get_kz(as_list=True)[n].real, self.get_kz(as_list=True)[n].imag)
+            string += "\tModal Index (n_eff) = %0.5f \n"%(neff[n].real)
+            string += "\tGroup Index (n_g) = %0.5f \n"%(n_g[n].real)
+            string += "\tPercent of the mode in TE direction = %0.1f %% \n"%(tefrac[n])
+            string += "\tConfinement Factor (overlap with cfseg) = %0.1f \n"%(gammaE[n])
+            string += "\tEffective Area = %0.3f  um^2 \n"%(a_eff[n])
+            string += "\tAttenuation = %0.3f  1/cm \n"%(np.imag(neff[n]) * attn_factor)
+            string += "\tPropagation Constant = %0.3f + j*%0.3f  1/um \n"%(kz[n].real, kz[n].imag)
         
         return string
     
     
-    def get_n_eff(self, as_list=False):
+    def _exec_batch(self, attrs):
+        '''Fetch multiple values of every mode in `list_num` with a single `fimm.Exec()` call, instead of one round-trip to FimmWave per value.
+        
+        Parameters
+        ----------
+        attrs : list of strings
+            FimmWave attributes/functions of each mode, eg. `['neff()', 'modedata.neffg']`.
+        
+        Returns
+        -------
+        A list containing, for each attribute in `attrs`, a list of that attribute's value for each mode.
+        '''
+        cmds, keys = [], []
+        for attr in attrs:
+            for num, prefix in zip(self.list_num, self._prefixes):
+                if (attr, num) in self._cache: continue     # already fetched
+                keys.append(  (attr, num)  )
+                cmds.append(  prefix + attr  )
+        
+        if cmds:
+            out = fimm.Exec( "\n".join(cmds) )
+            if len(cmds) == 1:  out = [out]     # a single value is not returned as a list
+            if not isinstance(out, list) or len(out) != len(cmds):
+                ErrStr = "Mode: FimmWave did not return the requested mode data - please check if the modes have been calculated via WG.calc().\n\tFimmWave returned: `%s`"%(out)
+                raise UserWarning(ErrStr)
+            self._cache.update(  zip(keys, out)  )
+        
+        return [ [self._cache[(attr, num)] for num in self.list_num]   for attr in attrs ]
+    #end _exec_batch()
+    
+    
+    def _list_exec(self, attr, update=None):
+        '''Return FimmWave attribute `attr` (eg. 'neff()') of each mode in `list_num` as a list, fetching them all with a single `fimm.Exec()`.
+        If `update` is 0 or 1, `modedata.update(update)` is run first.'''
+        if update is not None: self._update_modedata(update)
+        return self._exec_batch( [attr] )[0]
+    
+    def _update_modedata(self, level):
+        '''Run `modedata.update(level)` in FimmWave, unless it was already run for this Mode.  `update(1)` calculates all the modedata, so also covers `update(0)`.'''
+        num = self.list_num[0]
+        prior = self._modedata_level.get(num, -1)
+        if prior >= level: return
+        fimm.Exec(self._prefixes[0] + "modedata.update(" + str(level) + ")")
+        self._modedata_level[num] = max(level, prior)
+    
+    def invalidate(self):
+        '''Forget all mode data fetched from FimmWave by this Mode object.  
+        Call this if the modes were re-calculated (eg. by `WG.calc()`) while you kept using the same Mode object.  Mode objects returned by a new call to `WG.mode()` always start out empty.'''
+        self._cache = {}
+        self._modedata_level = {}
+        self._wl = None
+        self._attn_factor = None
+        self._field_cache = {}
+    
+    
+    
+    def get_n_eff(self, as_list=False, asarray=False):
         '''Return the Modal index.
         
         Parameters
         ----------
         as_list : boolean, optional
-            If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.'''
-        out=[]
-        for num in self.list_num:
-            out.append(  fimm.Exec(self.modeString + "list[{" + str(num) + "}].neff()")  )
+            If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.
+        asarray : boolean, optional
+            If `asarray=True`, a numpy array with one value per mode is returned (even for a single mode), instead of a list.  False by default.'''
+        out = self._list_exec("neff()")
         
+        if asarray: return np.asarray(out, dtype=complex)
         if len(self.list_num) == 1 and as_list==False:
             out = out[0]
         return out
@@ -203,19 +352,18 @@ class Mode:
         return self.get_n_eff()
 
 
-    def get_n_g(self, as_list=False):
+    def get_n_g(self, as_list=False, asarray=False):
         '''Return the group index.
         
         Parameters
         ----------
         as_list : boolean, optional
-            If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.'''
-        fimm.Exec(  self.modeString + "list[{" + str(self.list_num[0]) + "}].modedata.update(1)" + "\n"  )
-        
-        out=[]
-        for num in self.list_num:
-            out.append(  fimm.Exec(self.modeString + "list[{" + str(num) + "}].modedata.neffg")  )
+            If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.
+        asarray : boolean, optional
+            If `asarray=True`, a numpy array with one value per mode is returned (even for a single mode), instead of a list.  False by default.'''
+        out = self._list_exec("modedata.neffg", update=1)
         
+        if asarray: return np.asarray(out, dtype=float)
         if len(self.list_num) == 1 and as_list==False:
             out = out[0]
         return out
@@ -228,18 +376,19 @@ class Mode:
         return self.get_n_g()
 
 
-    def get_kz(self, as_list=False):
+    def get_kz(self, as_list=False, asarray=False):
         '''Return the propagation constant.
         
         Parameters
         ----------
         as_list : boolean, optional
-            If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.'''
+            If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.
+        asarray : boolean, optional
+            If `asarray=True`, a numpy array with one value per mode is returned (even for a single mode), instead of a list.  False by default.'''
         #return fimm.Exec(self.modeString+"list[{"+str(self.list_num)+"}].beta()")
-        out=[]
-        for num in self.list_num:
-            out.append(  fimm.Exec(self.modeString + "list[{" + str(num) + "}].beta()")  )
+        out = self._list_exec("beta()")
         
+        if asarray: return np.asarray(out, dtype=complex)
         if len(self.list_num) == 1 and as_list==False:
             out = out[0]
         return out
@@ -260,11 +409,8 @@ class Mode:
         as_list : boolean, optional
             If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.'''
         #return fimm.Exec(self.modeString+"list[{"+str(self.list_num)+"}].modedata.tefrac")
-        out=[]
-        for num in self.list_num:
-            x = fimm.Exec(self.modeString + "list[{" + str(num) + "}].modedata.tefrac")
-            if x == -99:     x = None
-            out.append(  x  )
+        out = self._list_exec("modedata.tefrac")
+        out = [None if x == -99 else x   for x in out]     # -99 means not calculated
         
         if len(self.list_num) == 1 and as_list==False:
             out = out[0]
@@ -277,51 +423,51 @@ class Mode:
         return self.get_percent_TE()
     
     
-    def get_confinement(self, as_list=False):
+    def get_confinement(self, as_list=False, asarray=False):
         '''Return the confinement factor for this mode - how much of the optical mode overlaps with the waveguide segments set as "cfseg" (confinement factor). (See FimmWave Manual Sec.4.7)
         
         Parameters
         ----------
         as_list : boolean, optional
             If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.
+        asarray : boolean, optional
+            If `asarray=True`, a numpy array with one value per mode is returned (even for a single mode), instead of a list.  False by default.
         
         Returns
         -------
         float : fractional confinement factor (0-->1)
         '''
-        fimm.Exec(self.modeString+"list[{"+str(self.list_num[0])+"}].modedata.update(0)")
         #return fimm.Exec(self.modeString+"list[{"+str(self.list_num)+"}].modedata.gammaE")
-        out=[]
-        for num in self.list_num:
-            out.append(  fimm.Exec(self.modeString + "list[{" + str(num) + "}].modedata.gammaE")  )
+        out = self._list_exec("modedata.gammaE", update=0)
         
+        if asarray: return np.asarray(out, dtype=float)
         if len(self.list_num) == 1 and as_list==False:
             out = out[0]
         return out
     
-    def get_confinement_ey(self, as_list=False):
+    def get_confinement_ey(self, as_list=False, asarray=False):
         '''This is a confinement factor estimation that includes just the Ey component of the field, defined over the region specified by the csfeg flag (see FimmWave Manual Sec.4.7).
         
         Parameters
         ----------
         as_list : boolean, optional
             If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.
+        asarray : boolean, optional
+            If `asarray=True`, a numpy array with one value per mode is returned (even for a single mode), instead of a list.  False by default.
         
         Returns
         -------
         float : fractional confinement factor (0-->1)
         '''
-        fimm.Exec(self.modeString+"list[{"+str(self.list_num[0])+"}].modedata.update(0)")
         #return fimm.Exec(self.modeString+"list[{"+str(self.list_num)+"}].modedata.gammaEy")
-        out=[]
-        for num in self.list_num:
-            out.append(  fimm.Exec(self.modeString + "list[{" + str(num) + "}].modedata.gammaEy")  )
+        out = self._list_exec("modedata.gammaEy", update=0)
         
+        if asarray: return np.asarray(out, dtype=float)
         if len(self.list_num) == 1 and as_list==False:
             out = out[0]
         return out
     
-    def get_fill_factor(self, as_list=False):
+    def get_fill_factor(self, as_list=False, asarray=False):
         '''Return the fill factor for this mode.
         This is a measure of the fraction of the mode power flux defined over the region specified by the csfeg flag (see FimmWave Manual Sec.4.7).
         
@@ -329,44 +475,44 @@ class Mode:
         ----------
         as_list : boolean, optional
             If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.
+        asarray : boolean, optional
+            If `asarray=True`, a numpy array with one value per mode is returned (even for a single mode), instead of a list.  False by default.
         
         Returns
         -------
         float : fractional fill factor (0-->1)
         '''
-        fimm.Exec(self.modeString+"list[{"+str(self.list_num[0])+"}].modedata.update(0)")
         #return fimm.Exec(self.modeString+"list[{"+str(self.list_num)+"}].modedata.fillFac")
-        out=[]
-        for num in self.list_num:
-            out.append(  fimm.Exec(self.modeString + "list[{" + str(num) + "}].modedata.fillFac")  )
+        out = self._list_exec("modedata.fillFac", update=0)
         
+        if asarray: return np.asarray(out, dtype=float)
         if len(self.list_num) == 1 and as_list==False:
             out = out[0]
         return out
     
-    def get_dispersion(self, as_list=False):
+    def get_dispersion(self, as_list=False, asarray=False):
         '''Return the mode dispersion (ps/nm/km) - see Fimmwave Manual Sec. 13.2.8 for definition.
         
         Parameters
         ----------
         as_list : boolean, optional
             If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.
+        asarray : boolean, optional
+            If `asarray=True`, a numpy array with one value per mode is returned (even for a single mode), instead of a list.  False by default.
         
         Returns
         -------
         float : mode dispersion (ps/nm/km)
         '''
-        fimm.Exec(self.modeString+"list[{"+str(self.list_num[0])+"}].modedata.update(1)")  # calc 'all'
         #return fimm.Exec(self.modeString+"list[{"+str(self.list_num)+"}].modedata.dispersion")
-        out=[]
-        for num in self.list_num:
-            out.append(  fimm.Exec(self.modeString + "list[{" + str(num) + "}].modedata.dispersion")  )
+        out = self._list_exec("modedata.dispersion", update=1)
         
+        if asarray: return np.asarray(out, dtype=float)
         if len(self.list_num) == 1 and as_list==False:
             out = out[0]
         return out
     
-    def get_attenuation(self, as_list=False):
+    def get_attenuation(self, as_list=False, asarray=False):
         '''Return the mode attenuation (1/cm), calculated from the imaginary part of the effective (modal) index.
         Corresponds to `ModeLossEV` (complex attenuation), so only available with complex solvers.
         
@@ -374,27 +520,31 @@ class Mode:
         ----------
         as_list : boolean, optional
             If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.
+        asarray : boolean, optional
+            If `asarray=True`, a numpy array with one value per mode is returned (even for a single mode), instead of a list.  False by default.
         
         Returns
         -------
         float : mode attenuation (1/cm)
         '''
-        #fimm.Exec(self.modeString + "list[{" + str(self.list_num[0]) + "}].modedata.update(0)")
-        #return fimm.Exec(self.modeString+"list[{"+str(self.list_num)+"}].modedata.alpha")
-        '''out=[]
-        for num in self.list_num:
-            #out.append(  fimm.Exec(self.modeString + "list[{" + str(num) + "}].modedata.alpha")  )
-            out.append(  self.get_n_eff(as_list=True).imag * 4*math.pi / (get_wavelength()*1e-4)  )
-            '''
         # alpha [cm^-1] = imaginary(n_eff) * 4 pi / (wavelength [cm])
-        out = (   np.imag( self.get_n_eff(as_list=True) ) * 4*math.pi / (get_wavelength()*1e-4  )   ).tolist()  
-        # math on the numpy array returned by np.imag(), then conv. back to list
+        neffs = np.asarray( self.get_n_eff(as_list=True), dtype=np.complex128 )
+        out = neffs.imag * self._attenuation_factor()
         
+        if asarray: return out
+        out = out.tolist()
         if len(self.list_num) == 1 and as_list==False:
             out = out[0]
         return out
     
-    def get_material_loss(self, as_list=False):
+    def _attenuation_factor(self):
+        '''Factor to convert imag(n_eff) to attenuation (1/cm): 4 pi / (wavelength [cm]).  The wavelength is only fetched from FimmWave once per Mode object.'''
+        if self._attn_factor is None:
+            if self._wl is None: self._wl = get_wavelength()
+            self._attn_factor = _FOUR_PI / (self._wl*1e-4)
+        return self._attn_factor
+    
+    def get_material_loss(self, as_list=False, asarray=False):
         '''Return the loss due to material absorption.  Based on the mode overlap with materials that have an attenuation/absorption coefficient.
         Corresponds to `ModeLossOV` in the GUI.
         If you are using a complex solver then modeLossOV is just the "material loss". When using a complex solver in absence of absorbing boundaries then modeLossEV and modeLossOV should match, provided that nx and ny are sufficient.
@@ -404,61 +554,61 @@ class Mode:
         ----------
         as_list : boolean, optional
             If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.
+        asarray : boolean, optional
+            If `asarray=True`, a numpy array with one value per mode is returned (even for a single mode), instead of a list.  False by default.
         
         Returns
         -------
         float : mode attenuation (1/cm)
         '''
-        fimm.Exec(self.modeString + "list[{" + str(self.list_num[0]) + "}].modedata.update(0)")
-
-        out=[]
-        for num in self.list_num:
-            out.append(  fimm.Exec(self.modeString + "list[{" + str(num) + "}].modedata.alpha") * 1e4  )  # convert to 1/cm
+        out = self._list_exec("modedata.alpha", update=0)
+        out = [x * 1e4   for x in out]     # convert to 1/cm
         
+        if asarray: return np.asarray(out, dtype=float)
         if len(self.list_num) == 1 and as_list==False:
             out = out[0]
         return out
     
-    def get_effective_area(self, as_list=False):
+    def get_effective_area(self, as_list=False, asarray=False):
         '''Return the effective core area (um^2).
         
         Parameters
         ----------
         as_list : boolean, optional
             If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.
+        asarray : boolean, optional
+            If `asarray=True`, a numpy array with one value per mode is returned (even for a single mode), instead of a list.  False by default.
         
         Returns
         -------
         float : effective core area (um^2)
         '''
-        fimm.Exec(self.modeString+"list[{"+str(self.list_num[0])+"}].modedata.update(0)")
         #return fimm.Exec(self.modeString+"list[{"+str(self.list_num)+"}].modedata.a_eff")
-        out=[]
-        for num in self.list_num:
-            out.append(  fimm.Exec(self.modeString + "list[{" + str(num) + "}].modedata.a_eff")  )
+        out = self._list_exec("modedata.a_eff", update=0)
         
+        if asarray: return np.asarray(out, dtype=float)
         if len(self.list_num) == 1 and as_list==False:
             out = out[0]
         return out
     
-    def get_side_loss(self, as_list=False):
+    def get_side_loss(self, as_list=False, asarray=False):
         '''Return the side power loss (1/um).  CHECK THESE UNITS - the popup window says 1/cm.
         
         Parameters
         ----------
         as_list : boolean, optional
             If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.
+        asarray : boolean, optional
+            If `asarray=True`, a numpy array with one value per mode is returned (even for a single mode), instead of a list.  False by default.
         
         Returns
         -------
         float : side power loss (1/um)
         '''
-        fimm.Exec(self.modeString+"list[{"+str(self.list_num[0])+"}].modedata.update(0)")
         #return fimm.Exec(self.modeString+"list[{"+str(self.list_num)+"}].modedata.sideploss")
-        out=[]
-        for num in self.list_num:
-            out.append(  fimm.Exec(self.modeString + "list[{" + str(num) + "}].modedata.sideploss")  )
+        out = self._list_exec("modedata.sideploss", update=0)
         
+        if asarray: return np.asarray(out, dtype=float)
         if len(self.list_num) == 1 and as_list==False:
             out = out[0]
         return out
@@ -472,9 +622,7 @@ class Mode:
         as_list : boolean, optional
             If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.'''
         #return fimm.Exec(self.modeString+"list[{"+str(self.list_num)+"}].state")
-        out=[]
-        for num in self.list_num:
-            out.append(  fimm.Exec(self.modeString + "list[{" + str(num) + "}].state")  )
+        out = self._list_exec("state")
         
         if len(self.list_num) == 1 and as_list==False:
             out = out[0]
@@ -491,15 +639,17 @@ class Mode:
         #fimm.Exec(self.modeString+"setstate({"+str(self.list_num)+"},1)")
         for num in self.list_num:
             fimm.Exec(self.modeString + "setstate({" + str(num) + "},1)")
+            self._cache.pop(  ("state", num), None  )
 
     def deactivate(self):
         '''Set fimmwave state to Inactive, 0'''
         #fimm.Exec(self.modeString+"setstate({"+str(self.list_num)+"},0)")
         for num in self.list_num:
             fimm.Exec(self.modeString + "setstate({" + str(num) + "},0)")
+            self._cache.pop(  ("state", num), None  )
     
     
-    def get_field(self, component, include_pml=True, as_list=False):
+    def get_field(self, component, include_pml=True, as_list=False, asarray=False):
         '''field(component [, include_pml])
         Get the value of a particular electromagnetic field from this Mode.
         Returns the field component of the whole mode profile.
@@ -514,14 +664,17 @@ class Mode:
             
         as_list : boolean, optional
             If a single-mode is returned, by default it's de-listed (just a singel array).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.
+        asarray : boolean, optional
+            If `asarray=True`, the fields are returned as a single numpy array indexed as [mode, x, y] (even for a single mode), instead of a list of lists.  False by default.
         
         
         Returns
         -------
         fieldarray : [Nx x Ny] list of all the field values.  
             Nx and Ny are set by `pyfimm.set_Nx()` & `.set_Ny()`.
-            It is recommended that you convert this to an array for performing math, eg. `numpy.array( fieldarray )`
+            It is recommended that you convert this to an array for performing math, eg. `numpy.array( fieldarray )`, or use `asarray=True`.
             If multiple modes were selected (eg. `WG.mode([0,1,2])`), then a list is returned containing the numpy field array for each mode, eg. `fieldarray = [  Mode0[Nx x Ny],  Mode1[Nx x Ny],  Mode2[Nx x Ny]  ]`
+            Fields are only fetched from FimmWave once per Mode object - repeated calls return the same arrays (see `invalidate()`).
         '''
         if include_pml:
             if DEBUG(): print "Mode.field(): include_pml"
@@ -531,42 +684,35 @@ class Mode:
 
         component = component.lower().strip()   # to lower case & strip whitespace
         
-        #if len(component) == 1:
-        if component == 'Ex'.lower():
-            comp='1'
-        elif component == 'Ey'.lower():
-           comp='2'
-        elif component == 'Ez'.lower():
-           comp='3'
-        elif component == 'Hx'.lower():
-           comp='4'
-        elif component == 'Hy'.lower():
-           comp='5'
-        elif component == 'Hz'.lower():
-           comp='6'
-        elif component == 'I'.lower():
-           comp='7'
-        else:
-            raise ValueError("Mode.field(): Invalid field component requested.")
+        try:
+            comp = _FIELD_CODES[component]
+        except KeyError:
+            raise ValueError("Mode.field(): Invalid field component requested: `%s`."%(component))
         
         if DEBUG(): print "Mode.field():  f = " + self.modeString + \
         "list["+str(self.list_num)+"].profile.data.getfieldarray("+comp+","+pml+")  \n\t f.fieldarray" 
         
-        # Check if modes have been calc()'d:
-        a = fimm.Exec(self.modeString+"list["+str(self.list_num[0])+"].profile.update()")
-        # Check if modes have been calc()'d:
-        if DEBUG(): print "field():  #",a[:-2].strip(),'#\n'
-        if a[:-2].strip() != '':
-            WarningString = "FimmWave error: please check if the modes have been calculated via WG.calc().\n\tFimmWave returned: `%s`"%a[:-2].strip()
-            raise UserWarning(WarningString)
+        # only fetch the fields that this Mode object hasn't fetched before:
+        missing = [(num, prefix) for num, prefix in zip(self.list_num, self._prefixes)   if (num, comp, pml) not in self._field_cache]
+        
+        if missing:
+            # Check if modes have been calc()'d:
+            a = fimm.Exec(self._prefixes[0]+"profile.update()")
+            # Check if modes have been calc()'d:
+            if DEBUG(): print "field():  #",a[:-2].strip(),'#\n'
+            if a[:-2].strip() != '':
+                WarningString = "FimmWave error: please check if the modes have been calculated via WG.calc().\n\tFimmWave returned: `%s`"%a[:-2].strip()
+                raise UserWarning(WarningString)
         
         #fimm.Exec("Set f = " + self.modeString + "list[" + str(self.list_num) + "].profile.data.getfieldarray(" + comp + "," + pml + ")  \n"  )
         #field =  fimm.Exec("f.fieldarray")
-        out=[]
-        for num in self.list_num:
-            fimm.Exec("Set f = " + self.modeString + "list[" + str(num) + "].profile.data.getfieldarray(" + comp + "," + pml + ")  \n"  )  # must set this as a variable to avoid memory error
-            out.append(  fimm.Exec("f.fieldarray")  )   # grab the array (as list)
+        for num, prefix in missing:
+            fimm.Exec("Set f = " + prefix + "profile.data.getfieldarray(" + comp + "," + pml + ")  \n"  )  # must set this as a variable to avoid memory error
+            self._field_cache[(num, comp, pml)] = fimm.Exec("f.fieldarray")   # grab the array (as list)
         
+        out = [ self._field_cache[(num, comp, pml)]   for num in self.list_num ]
+        
+        if asarray: return np.asarray(out)
         if len(self.list_num) == 1 and as_list==False:
             out = out[0]
         return out
@@ -579,81 +725,47 @@ class Mode:
     field = get_field
         
         
-    def P(self):
-        '''Return the Power Density - I think in J/um'''
-        if len(self.list_num) > 1:
-            ErrStr = "Mode.P(): Only supports a single mode number being passed."
-            raise NotImplementedError(ErrStr)
-        else:
-            num = self.list_num[0]
-            
+    def P(self, as_list=False):
+        '''Return the Power Density - I think in J/um
+        
+        Parameters
+        ----------
+        as_list : boolean, optional
+            If a single-value is returned, by defualt it's de-listed (just a float/int).  If `as_list=True`, then it is returned as a single-element list - useful when iterating multiple modes.  False by default.'''
         # Check if modes have been calc()'d:
-        a = fimm.Exec(self.modeString+"list["+str(num)+"].profile.update()"+"\n")
+        a = fimm.Exec(self._prefixes[0]+"profile.update()"+"\n")
         # Check if modes have been calc()'d:
         if DEBUG(): print "P():  #",a[:-2].strip(),'#\n'
         if a[:-2].strip() != '':
             ErrStr = "FimmWave error: please check if the modes have been calculated via WG.calc().\n\tFimmWave returned: `%s`"%a[:-2].strip()
             raise UserWarning(ErrStr)
         
-        fimm.Exec(self.modeString+"list["+str(num)+"].profile.data.writeamf("+\
+        # Fetch Ex, Ey, Hx & Hy of every mode with a single FimmWave call (same as `get_field()`):
+        cmds, n = "", 0
+        for prefix in self._prefixes:
+            fieldString = prefix + "profile.data.getfieldarray(%s,1)  \n"
+            for comp in ['1', '2', '4', '5']:
+                cmds += "Set f%i = "%(n) + fieldString%(comp)     # must set these as variables to avoid memory error
+                n += 1
+        cmds += " \n ".join(  ["f%i.fieldarray"%(i) for i in range(n)]  )
+        fields = fimm.Exec( cmds )
+        if not isinstance(fields, list) or len(fields) != n:
+            ErrStr = "Mode.P(): FimmWave did not return the requested field arrays.\n\tFimmWave returned: `%s`"%(fields)
+            raise UserWarning(ErrStr)
+        # one contiguous array, indexed as [mode, component, grid point]:
+        fields = np.ascontiguousarray(fields, dtype=np.complex128).reshape( len(self.list_num), 4, -1 )
+        
+        # The grid size & extents are only available from the header of an AMF file (same grid for every mode):
+        num = self.list_num[0]
+        fimm.Exec(self._prefixes[0]+"profile.data.writeamf("+\
         "mode"+str(num)+"_pyFIMM.amf,%10.9f)"   )
-
-        ## AMF File Clean-up
         fin = open("mode"+str(num)+"_pyFIMM.amf", "r")
-        data_list = fin.readlines()
+        header = [fin.readline() for i in range(3)]     # skip the field data
         fin.close()
-
-        # Delete File Header
-        nxy_data = data_list[1]
-        xy_data = data_list[2]
-        slvr_data = data_list[6]
-        del data_list[0:9]
-        
-        fout = open("nxy"+str(num)+"_pyFIMM.txt", "w")
-        fout.writelines(nxy_data)
-        fout.close()
-        nxy = np.loadtxt("nxy"+str(num)+"_pyFIMM.txt", comments='//')
-        nx = int(nxy[0])
-        ny = int(nxy[1])
-
-        fout = open("xy"+str(num)+"_pyFIMM.txt", "w")
-        fout.writelines(xy_data)
-        fout.close()
-        xy = np.loadtxt("xy"+str(num)+"_pyFIMM.txt", comments='//')
-        
-        fout = open("slvr"+str(num)+"_pyFIMM.txt", "w")
-        fout.writelines(slvr_data)
-        fout.close()
-        iscomplex = np.loadtxt("slvr"+str(num)+"_pyFIMM.txt", comments='//')
-        
-         # Resave Files
-        fout = open("Ex"+str(num)+"_pyFIMM.txt", "w")
-        fout.writelines(data_list[1:nx+2])
-        fout.close()
-        fout = open("Ey"+str(num)+"_pyFIMM.txt", "w")
-        fout.writelines(data_list[(nx+2)+1:2*(nx+2)])
-        fout.close()
-        fout = open("Hx"+str(num)+"_pyFIMM.txt", "w")
-        fout.writelines(data_list[3*(nx+2)+1:4*(nx+2)])
-        fout.close()
-        fout = open("Hy"+str(num)+"_pyFIMM.txt", "w")
-        fout.writelines(data_list[4*(nx+2)+1:5*(nx+2)])
-        fout.close()
-        
-        del data_list
-        
-        # Get Data
-        Ex = np.loadtxt("Ex"+str(num)+"_pyFIMM.txt")
-        Ey = np.loadtxt("Ey"+str(num)+"_pyFIMM.txt")
-        Hx = np.loadtxt("Hx"+str(num)+"_pyFIMM.txt")
-        Hy = np.loadtxt("Hy"+str(num)+"_pyFIMM.txt")
-        
-        Ex = np.array(Ex)
-        Ey = np.array(Ey)
-        Hx = np.array(Hx)
-        Hy = np.array(Hy)
-        
-        Sz = (Ex*Hy.conjugate() - Ey*Hx.conjugate()) / 2.0
+        
+        # Parse the File Header, without the trailing `//` comments
+        nx, ny = [int(v) for v in header[1].split('//')[0].split()[:2]]
+        xy = [float(v) for v in header[2].split('//')[0].split()[:4]]
         
         xStart = xy[0]
         xEnd = xy[1]
@@ -664,7 +776,16 @@ class Mode:
         dy = (yEnd - yStart)/ny
         
         dA = dx*dy*1e-12
-        return sum(Sz)*dA
+        
+        # Integrate Sz = (Ex*Hy.conjugate() - Ey*Hx.conjugate()) / 2.0 over the grid, for each mode.
+        # np.vdot(a,b) = sum( a.conjugate()*b ), in one pass without allocating Sz:
+        out = []
+        for Ex, Ey, Hx, Hy in fields:
+            out.append(  0.5 * dA * (  np.vdot(Hy, Ex) - np.vdot(Hx, Ey)  )  )
+        
+        if len(self.list_num) == 1 and as_list==False:
+            out = out[0]
+        return out
     #end P()
     
     
@@ -690,6 +811,15 @@ class Mode:
         return_handles : { True | False }, optional
             If True, will return handles to the figure, axes and images.  False by default.
         
+        keep_amf : boolean, optional
+            If True, the AMF files written by FimmWave (in the folder `AMF_FolderStr()`) are kept after plotting.  Otherwise they are deleted, unless DEBUG() is enabled.  False by default.
+        
+        fig : matplotlib figure, optional
+            Figure to re-use, eg. from a previous call with `return_handles=True`.  It is cleared with `fig.clf()` and the new subplots are drawn in it, which is much faster than creating a new figure on each call in a loop.  By default a new figure is created.
+        
+        show : boolean, optional
+            If False, the figure window is not shown/raised - useful for only saving the figure to a file, eg. in batch jobs or with the non-interactive 'Agg' backend (`matplotlib.pyplot.switch_backend('Agg')`).  True by default.
+        
         
         Returns
         -------
@@ -739,7 +869,8 @@ class Mode:
         >>> fig1.savefig('Mode with attenuation.png')
         
         '''
-        import os, sys
+        import matplotlib.pyplot as plt     # imported here so that `import pyfimm` doesn't load matplotlib
+        from matplotlib import cm           # color maps
         
         if len(args) == 0:
             field_cpt_in = None
@@ -766,6 +897,9 @@ class Mode:
         
         return_handles = kwargs.pop('return_handles', False)
         annotations = kwargs.pop('annotations', True)
+        keep_amf = kwargs.pop('keep_amf', False)
+        show = kwargs.pop('show', True)
+        fig1 = kwargs.pop('fig', None)
         
         ptitle = kwargs.pop('title',None)
         if ptitle:
@@ -777,12 +911,15 @@ class Mode:
         '''Unused kwargs returned at end of this function'''
         
         
-        # Check if modes have been calc()'d:
-        a = fimm.Exec(self.modeString+"list["+str(self.list_num[0])+"].profile.update()")
-        # Check if modes have been calc()'d:
-        if DEBUG(): print "plot():  #",a[:-2].strip(),'#\n'
-        if a[:-2].strip() != '':
-            ErrStr = "FimmWave error: please check if the modes have been calculated via `WG.calc()`.\n\tFimmWave returned: `%s`"%a[:-2].strip()
+        # Check if modes have been calc()'d, for all modes with a single FimmWave call:
+        a = fimm.Exec(  "\n".join( [prefix+"profile.update()" for prefix in self._prefixes] )  )
+        if isinstance(a, list):
+            a = " ".join( [str(x).strip() for x in a] ).strip()     # one reply per mode
+        else:
+            a = a[:-2].strip()
+        if DEBUG(): print "plot():  #",a,'#\n'
+        if a != '':
+            ErrStr = "FimmWave error: please check if the modes have been calculated via `WG.calc()`.\n\tFimmWave returned: `%s`"%a
             raise UserWarning(ErrStr)
         
         
@@ -790,123 +927,71 @@ class Mode:
         nmodes = self.get_n_eff(as_list=True)
         if DEBUG(): print "mode.plot(): nmodes =", nmodes
         
+        if field_cpt_in == None:
+            # TE fractions of all modes, to choose the field component:
+            tefracs = self._list_exec("modedata.tefrac")
+        
         # create the required number of axes:
         # Options for the subplots:
         sbkw = {'axisbg': (0.15,0.15,0.15)}    # grey plot background
         
+        figkw = {}
+        if fig1 is not None:
+            fig1.clf()      # Re-use the passed figure
+            figkw['num'] = fig1.number
+        
         if len(self.list_num) == 1:
-            fig1, axs = plt.subplots(nrows=1, ncols=1, subplot_kw=sbkw)
+            fig1, axs = plt.subplots(nrows=1, ncols=1, subplot_kw=sbkw, **figkw)
         else:
-            Rows = int(   math.ceil( len(self.list_num)/2. )   )
-            fig1, axs = plt.subplots(  nrows=Rows , ncols=2, sharex=True, sharey=True, subplot_kw=sbkw)
+            Rows = ( len(self.list_num) + 1 ) // 2     # 2 columns
+            fig1, axs = plt.subplots(  nrows=Rows , ncols=2, sharex=True, sharey=True, subplot_kw=sbkw, **figkw)
             if len(self.list_num) % 2 == 1:
                 '''If odd# of modes, Delete the last (empty) axis'''
                 fig1.delaxes( axs[ len(axs)-1,  1]  )
                 #axs = axs[:-1]  # remove del'd axis from list
         
+        # flat list of the axes, one per mode, in order:
+        axes_flat = list( np.atleast_1d(axs).ravel() )[ :len(self.list_num) ]   # without the deleted axis
+        
         fig1.suptitle(plot_title)   # figure title
-        fig1.canvas.draw()  # update the figure
+        
+        # SubFolder to hold temp files:
+        amf_folder = str( AMF_FolderStr() )
+        try:
+            os.makedirs( amf_folder )        # Create the new folder
+        except OSError:
+            if not os.path.isdir( amf_folder ): raise     # already exists
+        
+        # write an AMF file with all the field components, for all modes with a single FimmWave call:
+        amf_files = [ os.path.join( amf_folder, "mode"+str(num)+"_pyFIMM.amf" )   for num in self.list_num ]     # name of files
+        cmds = "\n".join(  [ prefix+"profile.data.writeamf("+amf_file+",%10.6f)"   for prefix, amf_file in zip(self._prefixes, amf_files) ]  )
+        if DEBUG(): print "Mode.plot():  " + cmds
+        fimm.Exec( cmds )
+        
+        # Find Field Component of each mode
+        if field_cpt_in == None:
+            '''If unspecified, use the component with higher field frac.'''
+            field_cpts = [ 'ex' if tepercent > 50 else 'ey'   for tepercent in tefracs ]
+        else:
+            field_cpts = [field_cpt] * len(self.list_num)
+        
+        # Read & parse the AMF files - in parallel threads for multiple modes, as this is mostly file I/O:
+        keep = keep_amf or DEBUG()
+        if len(amf_files) == 1:
+            parsed = [ _parse_amf(amf_files[0], field_cpts[0], keep) ]
+        else:
+            pool = ThreadPool(  min(8, len(amf_files))  )
+            try:
+                parsed = pool.map(  lambda args: _parse_amf(*args),  [(f, c, keep) for f, c in zip(amf_files, field_cpts)]  )
+            finally:
+                pool.close()
+                pool.join()     # wait for the worker threads to exit
         
         ims = []
         for n, num   in   enumerate(self.list_num):
-            # Which axis to draw on:
-            if len(self.list_num) == 1:
-                '''only single plot'''
-                axis = axs
-            elif len(np.shape(axs)) == 1:
-                '''only one row, so axs = [ax1, ax2]'''
-                axis = axs[ n ]
-            else:
-                '''multiple rows, so axs=[ [ax1,ax2], [ax3,ax4]...]'''
-                axis = axs[ math.floor( n/2. ),  n%2. ]
-            
-            # write an AMF file with all the field components.
-            mode_FileStr = "mode"+str(num)+"_pyFIMM.amf"     # name of files
-            # SubFolder to hold temp files:
-            if not os.path.isdir(str( AMF_FolderStr() )):
-                os.mkdir(str( AMF_FolderStr() ))        # Create the new folder
-            mode_FileStr = os.path.join( AMF_FolderStr(), mode_FileStr )
-            
-            if DEBUG(): print "Mode.plot():  " + self.modeString+"list[" + str(num) + "].profile.data.writeamf("+mode_FileStr+",%10.6f)"
-            fimm.Exec(self.modeString+"list[" + str(num) + "].profile.data.writeamf("+mode_FileStr+",%10.6f)")
-
-            ## AMF File Clean-up
-            #import os.path, sys  # moved to the top
-            fin = open(mode_FileStr, "r")
-            if not fin: raise IOError("Could not open '"+ mode_FileStr + "' in " + sys.path[0] + ", Type: " + str(fin))
-            data_list = fin.readlines()
-            fin.close()
-
-            # Delete File Header
-            nxy_data = data_list[1]
-            xy_data = data_list[2]
-            slvr_data = data_list[6]
-            del data_list[0:9]
-            
-            # strip the comment lines from the nxy file:
-            nxyFile = os.path.join( AMF_FolderStr(), "mode" + str(num) + "_pyFIMM_nxy.txt")
-            fout = open(nxyFile, "w")
-            fout.writelines(nxy_data)
-            fout.close()
-            nxy = np.loadtxt(nxyFile, comments='//')
-            nx = int(nxy[0])
-            ny = int(nxy[1])
-            
-            xyFile = os.path.join( AMF_FolderStr(), "mode" + str(num) + "_pyFIMM_xy.txt")
-            fout = open(xyFile, "w")
-            fout.writelines(xy_data)
-            fout.close()
-            xy = np.loadtxt(xyFile, comments='//')
-            
-            slvrFile = os.path.join( AMF_FolderStr(), "mode" + str(num) + "_pyFIMM_slvr.txt")
-            fout = open(slvrFile, "w")
-            fout.writelines(slvr_data)
-            fout.close()
-            iscomplex = np.loadtxt(slvrFile, comments='//')
-        
-            # Find Field Component
-            if field_cpt_in == None:
-                '''If unspecified, use the component with higher field frac.'''
-                tepercent = fimm.Exec(self.modeString + "list[{" + str(num) + "}].modedata.tefrac")
-                if tepercent > 50:
-                    field_cpt = 'Ex'.lower()
-                else:
-                    field_cpt = 'Ey'.lower()
-            #end if(field_cpt_in)
-            
-            if field_cpt == 'Ex'.lower():
-                data = data_list[1:nx+2]
-            elif field_cpt == 'Ey'.lower():
-                data = data_list[(nx+2)+1:2*(nx+2)]
-            elif field_cpt == 'Ez'.lower():
-                data = data_list[2*(nx+2)+1:3*(nx+2)]
-            elif field_cpt == 'Hx'.lower():
-                data = data_list[3*(nx+2)+1:4*(nx+2)]
-            elif field_cpt == 'Hy'.lower():
-                data = data_list[4*(nx+2)+1:5*(nx+2)]
-            elif field_cpt == 'Hz'.lower():
-                data = data_list[5*(nx+2)+1:6*(nx+2)]
-            else:
-                ErrStr = 'Invalid Field component requested: ' + str(field_cpt)
-                raise ValueError(ErrStr)
-            
-            del data_list
-            
-            # Resave Files
-            mode_FileStr = mode_FileStr+"_"+field_cpt.strip().lower()
-            fout = open(mode_FileStr, "w")
-            fout.writelines(data)
-            fout.close()
-            
-            # Get Data
-            if iscomplex == 1:
-                field_real = np.loadtxt(mode_FileStr, usecols=tuple([i for i in range(0,2*ny+1) if i%2==0]))
-                field_imag = np.loadtxt(mode_FileStr, usecols=tuple([i for i in range(0,2*ny+2) if i%2!=0]))
-            else:
-                field_real = np.loadtxt(mode_FileStr)
-            
-            '''field_real = np.real(field)'''
-            
+            axis = axes_flat[n]     # Which axis to draw on
+            field_cpt = field_cpts[n]
+            xy, field_real = parsed[n]
             
             # Plot Data
             xStart = xy[0]
@@ -914,8 +999,10 @@ class Mode:
             yStart = xy[2]
             yEnd = xy[3]
             
-            im = axis.imshow(np.rot90(abs(field_real),1), cmap=cm.hot, aspect='auto', extent=(xStart,xEnd,yStart,yEnd))
-            im.set_interpolation('bilinear')
+            # abs() in-place, and rotate by 90deg (same as `np.rot90(field_real,1)`) into a single contiguous copy:
+            np.abs(field_real, out=field_real)
+            field_img = np.ascontiguousarray( field_real.T[::-1] )
+            im = axis.imshow(field_img, cmap=cm.hot, aspect='auto', extent=(xStart,xEnd,yStart,yEnd), interpolation='bilinear')
             ims.append(im)
 
             #axis.set_xlabel('x ($\mu$m)')
@@ -928,8 +1015,6 @@ class Mode:
                 
                 n_str = "$\mathregular{n_{eff} =}$ %0.5f"%(nmodes[n].real)
                 axis.text( 0.05, 0.9, n_str, transform=axis.transAxes, horizontalalignment='left', color='green', fontsize=9, fontweight='bold')
-            fig1.canvas.window().raise_()    # bring plot window to front
-            fig1.canvas.draw()  # update the figure
         #end for(list_num)
         
         '''
@@ -937,9 +1022,10 @@ class Mode:
         ax1.set_ylabel('y ($\mu$m)')
         ax1.set_title(  self.obj.name + ": Mode(" + str(self.modenum) + "): " + field_cpt.title()  )
         '''
-        #fig1.canvas.window().raise_()    # bring plot window to front
-        #fig1.canvas.draw()
-        fig1.show()
+        if show:
+            fig1.canvas.window().raise_()    # bring plot window to front
+            fig1.canvas.draw_idle()     # draw the figure once, after all modes are plotted
+            fig1.show()
         
         
         if kwargs:
@@ -978,6 +1064,9 @@ class Mode:
         closefigure : boolean, optional
             If `True`, will close the figure window after the file has been saved.  Useful for large for() loops.
         
+        show : boolean, optional
+            If `True`, will also show the figure window.  False by default, so no GUI calls are made when just saving files.
+        
         Extra keyword-arguments are passed to Mode.plot()
         
         
@@ -1004,7 +1093,7 @@ class Mode:
         fig1, ax1, im
             The matplotlib figure, axis and image (imshow) handles, returned only if `return_handles = True`.
         '''
-        import os.path
+        import matplotlib.pyplot as plt     # imported here so that `import pyfimm` doesn't load matplotlib
         
         if len(args) == 0:
             field_cpt = None
@@ -1024,6 +1113,7 @@ class Mode:
         returnhandles = kwargs.pop('return_handles', False)
         path = kwargs.pop('path', None)
         closefigure = kwargs.pop('closefigure', False)
+        show = kwargs.pop('show', False)
         
         ptitle = kwargs.pop('title',None)
         if ptitle:
@@ -1032,7 +1122,7 @@ class Mode:
             plot_title = self.obj.name + " - Mode " + str(self.modenum)
         
         # plot the mode:
-        handles   =  self.plot(field_cpt, title=ptitle, return_handles=True, **kwargs)
+        handles   =  self.plot(field_cpt, title=ptitle, return_handles=True, show=show, **kwargs)
         fig1 = handles[0]
         if path:
             savepath = path + '.png'  
@@ -1,18 +1,31 @@
 '''Tapered waveguide classes, part of pyFIMM.'''
 
 
-from __globals import *         # import global vars & FimmWave connection object
+#from __globals import DEBUG     # only needed for the commented-out debugging prints
 
 
-from __pyfimm import *       # import the main module (should already be imported), includes many 'rect' classes/funcs
-from __Mode import Mode            # import Mode class
+# only import the names used here:
+from __Classes import Node, Section     # import base Node class & Device Section class
+from __pyfimm import get_wavelength     # import the main module (should already be imported)
 from __Waveguide import Waveguide       # import Waveguide class
 from __Circ import Circ            # import Circ class
 #from __pyfimm import DEBUG()        # Value is set in __pyfimm.py
 from numpy import inf              # infinity, for hcurv/bend_radius
 #import numpy as np              # math
+import math
 
 
+# Joint types between Device elements, see `set_joint_type()`:
+_JOINT_STR2INT = {0:0, 'complete':0,
+                  1:1, 'normal fresnel':1, 'fresnel':1,
+                  2:2, 'oblique fresnel':2,
+                  3:3, 'special complete':3, 'special':3}
+_JOINT_INT2STR = {0:'complete', 1:'normal fresnel', 2:'oblique fresnel', 3:'special complete'}
+
+# Lens options, see `Lens.get_buildNode_str()`:
+_LENS_SIDES = {'left':0, 'right':1}
+_LENS_TYPES = {'distortion':0, 'polish convex':1, 'polish concave':2}
+
 class Taper(Node):
     """Taper( LHS, RHS, [Length, Method] )
     
@@ -50,6 +63,7 @@ class Taper(Node):
         self.length=0.0     # unused?
         self.__materialdb = None     # unused?
         self.origin = 'pyfimm'      # this one is used!
+        self.__jointtype = 0        # 'complete' joint by default, see set_joint_type()
     
         if len(args) == 2:
             self.type = 'taper'
@@ -91,14 +105,11 @@ class Taper(Node):
         jointoptions : Dictionary{} of options.  Allows for the Device.buildnode() to set various joint options, such as angle etc.  Please see help(Device) for what the possible options are.
         '''
         if isinstance(jtype, str): jtype=jtype.lower()   # make lower case
-        if jtype == 0 or jtype == 'complete':
-            self.__jointtype = 0
-        if jtype == 1 or jtype == 'normal fresnel' or jtype == 'fresnel':
-            self.__jointtype = 1
-        if jtype == 2 or jtype == 'oblique fresnel':
-            self.__jointtype = 2
-        if jtype == 3 or jtype == 'special complete' or jtype == 'special':
-            self.__jointtype = 3
+        try:
+            self.__jointtype = _JOINT_STR2INT[jtype]
+        except KeyError:
+            ErrStr = "set_joint_type(): Invalid joint type `%s`.  See help(set_joint_type) for the available options." %(jtype)
+            raise ValueError(ErrStr)
         
         if isinstance(jointoptions, dict):
             self.__jointoptions=jointoptions
@@ -114,13 +125,6 @@ class Taper(Node):
                 A True value will cause the output to be numeric, rather than string.  See help(set_joint_type) for the numerical/string correlations.  False by default.
                 (FYI, `asnumeric=True` is used in Device.buildNode()  )
         '''
-        try:
-            self.__jointtype    # see if variable exists
-        except AttributeError:
-            # if the variable doesn't exist yet:
-            if DEBUG(): print "unset " + self.name + ".__jointtype --> 'complete'   "
-            self.__jointtype = 0
-        
         if len(args) == 0:      asnumeric = False   # output as string by default
         if len(args) == 1:      asnumeric = args[0]
         if len(args) > 1:    raise ValueError("get_joint_type(): Too many arguments provided.")
@@ -128,14 +132,7 @@ class Taper(Node):
         if asnumeric:
             out= self.__jointtype
         else:
-            if self.__jointtype == 0:
-                out= 'complete'
-            elif self.__jointtype == 1:
-                out= 'normal fresnel'
-            elif self.__jointtype == 2:
-                out= 'oblique fresnel'
-            elif self.__jointtype == 3:
-                out= 'special complete'
+            out= _JOINT_INT2STR[self.__jointtype]
         #if DEBUG(): print "get_joint_type(): ", out
         return out
     #end get_joint_type()
@@ -232,6 +229,7 @@ class Lens(Node):
         self.bend_radius = inf    # inf means straight
         self.built=False     
         self.autorun = True   
+        self.__jointtype = 0        # 'complete' joint by default, see set_joint_type()
         self.origin = 'pyfimm'  
         
         #if len(args) == 1:
@@ -242,6 +240,14 @@ class Lens(Node):
             if len(self.wgbase.layers) < 2:
                 ErrStr = "Circ objects must have 2 or more layers to be converted into lenses."
                 raise UserWarning(ErrStr)
+            self._basetype = 'cyl'         # these 'types' are currently unused
+            self._get_base_width = lambda: 2 * self.wgbase.get_radius()
+        elif isinstance( self.wgbase, Waveguide):
+            self._basetype = 'rect'
+            self._get_base_width = lambda: self.wgbase.get_width()
+        else:
+            ErrStr = "Unsupported object passed for basis waveguide of Lens, with type `%s`.  "%(type(self.wgbase)) + "Please pass a Waveguide or Circ object."
+            raise ValueError(ErrStr)
         #elif len(args) == 2:
         #    self.type = 'wglens'
         #    self.wgbase = wgbase
@@ -285,11 +291,10 @@ class Lens(Node):
         
         if kwargs:
             '''If there are unused key-word arguments'''
-            ErrStr = "WARNING: Lens(): Unrecognized keywords provided: {"
-            for k in kwargs.iterkeys():
-                ErrStr += "'" + k + "', "
-            ErrStr += "}.    Continuing..."
+            ErrStr = "WARNING: Lens(): Unrecognized keywords provided: {%s}.    Continuing..." %( ", ".join( ["'%s'"%(k) for k in kwargs] ) )
             print ErrStr
+        
+        self._get_lens_options()    # check the options now, rather than when the Device is built
     #end __init__
     
     
@@ -314,12 +319,15 @@ class Lens(Node):
     def get_length(self):
         '''Return the length in Z of this lens'''
         # TO DO: match up this result with fimmwave's length result
-        if isinstance( self.wgbase, Waveguide):
-            w = self.wgbase.get_width()
-        elif isinstance( self.wgbase, Circ):
-            w = 2 * self.wgbase.get_radius()
+        w = self._get_base_width()
         r = self.radius
-        return r - r*np.sin(  np.arccos(w/2/r)  )
+        half = 0.5 * w
+        if abs(r) < half:
+            ErrStr = "Lens.get_length(): Lens radius %s is smaller than half the base waveguide width %s." %(r, w)
+            raise ValueError(ErrStr)
+        # r - r*sin( arccos(w/2/r) ),  using  sin(arccos(x)) = sqrt(1 - x^2):
+        x = half / r
+        return r * (  1 - math.sqrt( 1 - x*x )  )
     
     def set_diameter(self, diam):
         '''Set diameter, D'''
@@ -338,6 +346,7 @@ class Lens(Node):
             Which method to create taper with.  Defaults to 'distortion', which distorts the passed WG into a lens. Polish instead removes parts of the structure to create the curved surface, but all interfaces in the WG remain straight.
         '''
         self.lens_type = type
+        self._get_lens_options()    # check the new type
     
     def get_type(self):
         '''Return the Lens type, one of: { 'distortion', 'polish convex', 'polish concave' }'''
@@ -354,14 +363,11 @@ class Lens(Node):
         jointoptions : Dictionary{} of options.  Allows for the Device.buildnode() to set various joint options, such as angle etc.  Please see help(Device) for what the possible options are.
         '''
         if isinstance(jtype, str): jtype=jtype.lower()   # make lower case
-        if jtype == 0 or jtype == 'complete':
-            self.__jointtype = 0
-        if jtype == 1 or jtype == 'normal fresnel' or jtype == 'fresnel':
-            self.__jointtype = 1
-        if jtype == 2 or jtype == 'oblique fresnel':
-            self.__jointtype = 2
-        if jtype == 3 or jtype == 'special complete' or jtype == 'special':
-            self.__jointtype = 3
+        try:
+            self.__jointtype = _JOINT_STR2INT[jtype]
+        except KeyError:
+            ErrStr = "set_joint_type(): Invalid joint type `%s`.  See help(set_joint_type) for the available options." %(jtype)
+            raise ValueError(ErrStr)
         
         if isinstance(jointoptions, dict):
             self.__jointoptions=jointoptions
@@ -385,13 +391,6 @@ class Lens(Node):
             >>> Waveguide1.get_joint_type( True )
             >   0
         '''
-        try:
-            self.__jointtype    # see if variable exists
-        except AttributeError:
-            # if the variable doesn't exist yet:
-            if DEBUG(): print "unset " + self.name + ".__jointtype --> 'complete'   "
-            self.__jointtype = 0
-                
         if len(args) == 0:      asnumeric = False   # output as string by default
         if len(args) == 1:      asnumeric = args[0]
         if len(args) > 1:    raise ValueError("get_joint_type(): Too many arguments provided.")
@@ -399,14 +398,7 @@ class Lens(Node):
         if asnumeric:
             out= self.__jointtype
         else:
-            if self.__jointtype == 0:
-                out= 'complete'
-            elif self.__jointtype == 1:
-                out= 'normal fresnel'
-            elif self.__jointtype == 2:
-                out= 'oblique fresnel'
-            elif self.__jointtype == 3:
-                out= 'special complete'
+            out= _JOINT_INT2STR[self.__jointtype]
         #if DEBUG(): print "get_joint_type(): ", out
         return out
     #end get_joint_type()
@@ -435,17 +427,7 @@ class Lens(Node):
             "app.subnodes[1].subnodes[3].cdev.eltlist[5]"
             '''
         
-        if isinstance( self.wgbase, Waveguide ):
-            type='rect'         # these 'types' are currently unused
-        elif isinstance( self.wgbase, Circ ):
-            type='cyl'
-        else:
-            ErrStr = "Unsupported object passed for basis waveguide of Lens, with type `%s`.  "%(type(self.wgbase) + "Please pass a Waveguide or Circ object.")
-            raise ValueError(ErrStr)
-        
-        fpstring = ""
-        
-        fpstring += nodestring + ".svp.lambda=" + str( get_wavelength()  ) + "   \n"
+        # base WG type (self._basetype) was checked in __init__
         
         if self.bend_radius == 0:
             self.bend_radius = inf
@@ -456,78 +438,72 @@ class Lens(Node):
         else:
             hcurv = 1.0/self.bend_radius
         #hcurv = 1/self.bend_radius
-        fpstring += nodestring + ".svp.hcurv=" + str(hcurv) + "   \n"
-        
-        fpstring += self.wgbase.get_solver_str(nodestring, target='wglens')
         
-        # which side of element should be lensed:
-        if self.side == 'left':
-            i = 0
-        elif self.side == 'right':
-            i = 1
-        else:
-            ErrStr = 'Invalid side for lens; please use "left" or "right" (default).'
-            raise ValueError(ErrStr)
-        fpstring += nodestring + ".which_end = " +str(i) + "   \n"
+        side, lens_type, joint_method = self._get_lens_options()
         
+        # build the FimmProp commands as a list of lines, joined once at the end:
+        fp = []
+        fp.append( nodestring + ".svp.lambda=" + str( get_wavelength()  ) )
+        fp.append( nodestring + ".svp.hcurv=" + str(hcurv) )
+        fp.append( self.wgbase.get_solver_str(nodestring, target='wglens').rstrip() )
         
-        # which type of lens
-        if self.lens_type.lower() == 'distortion':
-            i = 0
-        elif self.lens_type.lower() == 'polish convex':
-            i = 1
-        elif self.lens_type.lower() == 'polish concave':
-            i = 2
-        else:
-            ErrStr = 'Invalid option for lens type; please use "distortion" (default) or "polish convex" or "polish concave".'
-            raise ValueError(ErrStr)
-        fpstring += nodestring + ".lens_type = " +str(i) + "   \n"
-        
+        fp.append( nodestring + ".which_end = " +str(side) )     # which side of element should be lensed
+        fp.append( nodestring + ".lens_type = " +str(lens_type) )     # which type of lens
         
         if self.D:
-            fpstring += nodestring + ".D = " +str(self.D) + "   \n"
-        
+            fp.append( nodestring + ".D = " +str(self.D) )
         if self.d1:
-            fpstring += nodestring + ".d1 = " +str(self.d1) + "   \n"
-        
+            fp.append( nodestring + ".d1 = " +str(self.d1) )
         if self.d2:
-            fpstring += nodestring + ".d2 = " +str(self.d2) + "   \n"
-        
+            fp.append( nodestring + ".d2 = " +str(self.d2) )
         if self.etchdepth:
-            fpstring += nodestring + ".etchdepth = " +str(self.etchdepth) + "   \n"
-        
+            fp.append( nodestring + ".etchdepth = " +str(self.etchdepth) )
         if self.fillRIX:
-            fpstring += nodestring + ".fillrix = " +str(self.fillRIX) + "   \n"
+            fp.append( nodestring + ".fillrix = " +str(self.fillRIX) )
         
         # discretization options:
-        fpstring += nodestring + ".minSTPfrac = " +str(self.minSSfrac) + "   \n"
-        fpstring += nodestring + ".tolerance = " +str(self.tolerance) + "   \n"
+        fp.append( nodestring + ".minSTPfrac = " +str(self.minSSfrac) )
+        fp.append( nodestring + ".tolerance = " +str(self.tolerance) )
         
-        if self.joint_method:
-            if self.joint_method.lower() == 'complete':
-                fpstring += nodestring + ".joint_method = " +str(0) + "   \n"
-            elif self.joint_method.lower() == 'special complete':
-                fpstring += nodestring + ".joint_method = " +str(3) + "   \n"
-            elif self.joint_method.lower() == 'normal fresnel':
-                fpstring += nodestring + ".joint_method = " +str(1) + "   \n"
-            elif self.joint_method.lower() == 'oblique fresnel':
-                fpstring += nodestring + ".joint_method = " +str(2) + "   \n"
-            else:
-                ErrStr = "Invalid option for Taper Joint Method `%s`" %self.joint_method
-                raise ValueError(ErrStr)
+        if joint_method is not None:
+            fp.append( nodestring + ".joint_method = " +str(joint_method) )
         
         if self.int_method:
-            fpstring += nodestring + ".int_method = " +str(self.int_method) + "   \n"
+            fp.append( nodestring + ".int_method = " +str(self.int_method) )
         
-        if self.enableevscan == False:
-            i=0
-        else:
-            i=1
-        fpstring += nodestring + ".enableevscan = " +str(i) + "   \n"
+        fp.append( nodestring + ".enableevscan = " +str( 0 if self.enableevscan == False else 1 ) )
         
-        fpstring += nodestring + ".R = " +str(self.radius) + "   \n"
+        fp.append( nodestring + ".R = " +str(self.radius) )
+        
+        return "   \n".join(fp) + "   \n"
+    
+    
+    def _get_lens_options(self):
+        '''Return the FimmProp integer codes for (side, lens_type, joint_method), raising a ValueError for invalid options.  `joint_method` is None if unset.'''
+        try:
+            side = _LENS_SIDES[ self.side.lower() ]
+        except KeyError:
+            ErrStr = 'Invalid side for lens; please use "left" or "right" (default).'
+            raise ValueError(ErrStr)
+        
+        try:
+            lens_type = _LENS_TYPES[ self.lens_type.lower() ]
+        except KeyError:
+            ErrStr = 'Invalid option for lens type; please use "distortion" (default) or "polish convex" or "polish concave".'
+            raise ValueError(ErrStr)
+        
+        joint_method = None
+        if self.joint_method:
+            jm = self.joint_method
+            if isinstance(jm, str): jm = jm.lower()   # make lower case
+            try:
+                joint_method = _JOINT_STR2INT[ jm ]
+            except KeyError:
+                ErrStr = "Invalid option for Taper Joint Method `%s`" %self.joint_method
+                raise ValueError(ErrStr)
         
-        return fpstring
+        return side, lens_type, joint_method
+    #end _get_lens_options()
 #end class WGLens
     
     
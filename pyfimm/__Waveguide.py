@@ -9,7 +9,106 @@ from __globals import *         # import global vars & FimmWave connection objec
 
 from __pyfimm import *       # import the main module (should already be imported), includes many 'rect' classes/funcs
 from __Mode import Mode            # import Mode class
+import numpy as np
 from numpy import inf           # infinity, for hcurv/bend_radius
+import math                     # fsum
+import warnings                 # for deprecated methods
+from collections import OrderedDict    # LRU order of the build-string cache
+import logging
+log = logging.getLogger('pyfimm.Waveguide')     # messages go through the 'pyfimm' logger set up in __globals
+
+# FimmWave boundary-condition type codes, keyed by lower-case boundary name:
+_BC_TYPES = {'metal':1, 'electric wall':1, 'magnetic wall':2, 'periodic':3, 'transparent':4, 'impedance':5}
+
+# FimmWave symmetry codes for svp.hsymmetry/vsymmetry, keyed by symmetry setting (None if unset):
+_SYM_TYPES = {None:0, 'none':0, 'ExSymm':1, 'EySymm':2}
+
+def _emit_rix_layer(lp, lyr, parts, n):
+    '''Append the commands setting a refractive-index ('rix') Layer's index `n` (already evaluated from `lyr.n()`), for the layer node string `lp`.'''
+    n = repr( n )     # repr keeps full precision, unlike str()
+    parts.append( "%s.nr11 = %s\n%s.nr22 = %s\n%s.nr33 = %s" % (lp, n, lp, n, lp, n) )
+
+def _emit_mat_layer(lp, lyr, parts, n=None):
+    '''Append the commands setting a material-database ('mat') Layer's material & mole ratios, for the layer node string `lp`.  `n` is unused.'''
+    mat = lyr.material
+    log.debug( "%s: mx= %s  // my= %s", lp, mat.mx, mat.my )
+    parts.append( "%s.setMAT(%s) " % (lp, mat.mat) )
+    if mat.mx:   parts.append( "%s.mx = %s" % (lp, mat.mx) )
+    if mat.my:   parts.append( "%s.my = %s" % (lp, mat.my) )
+
+def _exec_parts(parts):
+    '''Send the FimmWave commands in list `parts` (each ending in a newline, or joined without separators) as one script, in a single fimm.Exec() round-trip.'''
+    return fimm.Exec( "".join(parts) )
+
+# Layer material commands, keyed by Material.type:
+_LAYER_MATERIAL_EMITTERS = {'rix':_emit_rix_layer, 'mat':_emit_mat_layer}
+
+def _etch_slice(slc):
+    '''Return a new Slice with the etch depth of Slice `slc` applied to its layers, for Waveguide.etched_slices.
+    The etched-away thickness becomes a top layer of the top-most material.  `slc` itself is not altered.'''
+    etchDepth = slc.etch
+    total = slc.thickness()
+    if etchDepth > total:
+        etchDepth = total
+    elif etchDepth < 0:
+        etchDepth = 0
+
+    if etchDepth == 0:
+        # drop a zero-thickness top layer
+        if slc.layers[-1].thickness == 0.0:
+            new_layers = slc.layers[:-1]
+        else:
+            new_layers = slc.layers
+    else:
+        # find the first layer reaching down to the etch plane, ie. with (thickness above its bottom) <= etchDepth:
+        cum = np.cumsum( slc.layer_thicknesses() )
+        nn = int(  np.searchsorted( cum - total, -etchDepth, side='left' )  )
+        below = cum[nn-1] if nn > 0 else 0      # thickness of the un-etched layers below layer nn
+        lyr = slc.layers[nn]
+        etched_layer = Layer(lyr.material,float(total-below-etchDepth),lyr.cfseg)
+        top_layer = Layer(slc.layers[-1].material,etchDepth,False)
+        new_layers = slc.layers[:nn] + [etched_layer, top_layer]
+    return Slice(new_layers,slc.width,slc.etch)
+#end _etch_slice()
+
+# FimmWave rectangular mode solvers, keyed by lower-case set_mode_solver() string: (svp.solvid, svp.buff type)
+# 'V1' (FDM) buffers take nx/ny/rix_tol, 'V2' (FMM) buffers take N_1d/mmatch.
+_SOLVER_TABLE = {
+    'vectorial fdm real':       (71, 'V1'),
+    'semivecte fdm real':       (23, 'V1'),
+    'semivectm fdm real':       (39, 'V1'),
+    'vectorial fdm complex':    (79, 'V1'),
+    'semivecte fdm complex':    (31, 'V1'),
+    'semivectm fdm complex':    (47, 'V1'),
+    'vectorial fmm real':       (65, 'V2'),
+    'semivecte fmm real':       (17, 'V2'),
+    'semivectm fmm real':       (33, 'V2'),
+    'vectorial fmm complex':    (73, 'V2'),
+    'semivecte fmm complex':    (25, 'V2'),
+    'semivectm fmm complex':    (41, 'V2'),
+}
+
+# Mode-list settings sent by Waveguide.get_solver_str() & __BuildRectNode(): (mlp attribute, global getter, default)
+_MLP_FIELDS = (
+    ('maxnmodes',   get_N,              10),
+    ('nx',          get_NX,             60),
+    ('ny',          get_NY,             60),
+    ('mintefrac',   get_min_TE_frac,    0),
+    ('maxtefrac',   get_max_TE_frac,    100),
+    ('evend',       get_min_EV,         '-1e+050'),
+    ('evstart',     get_max_EV,         '1e+050'),
+)
+
+# solver buffer commands, filled in by Waveguide.get_solver_str() & __BuildRectNode() with %-formatting:
+_SOLVER_BUFF_TEMPLATES = {
+    'V1': "%(ev)s.svp.buff=V1 %(nx)s %(ny)s 0 100 %(rix)s",
+    'V2': "%(ev)s.svp.buff=V2 %(n1d)s %(mmatch)s 1 300 300 15 25 0 5 5",
+}
+
+# Previously generated Waveguide.get_buildNode_str() outputs, keyed by Waveguide._get_buildNode_key():
+# Least-recently used strings are first, and are dropped once the cache is full.
+_BUILD_STR_CACHE = OrderedDict()
+_BUILD_STR_CACHE_SIZE = 128     # max. number of strings kept
 
 
 
@@ -167,34 +266,11 @@ class Waveguide(Node):
             self.__wavelength = get_wavelength()    # get global wavelength
             self.modes = []
             self.slices = args[0]
-            self.etched_slices = []
             self.bend_radius = inf      # Default to inf -straight.  Defined from center of WG slice.
             self.__materialdb = None
             
             # apply Etch Depths for each Slice
-            for slc in args[0]:
-                etchDepth = slc.etch
-                if etchDepth > slc.thickness():
-                    etchDepth = slc.thickness()
-                elif etchDepth < 0:
-                    etchDepth = 0
-
-                if etchDepth != 0:
-                    etched_layer_array = []
-                    for nn in range(0,len(slc)):
-                        if slc.thickness() - sum(slc.layer_thicknesses()[0:nn+1]) > etchDepth:
-                            etched_layer_array += [slc.layers[nn]]
-                        else:
-                            top_layer = Layer(slc.layers[len(slc)-1].material,etchDepth,False)
-                            etched_layer = Layer(slc.layers[nn].material,sum(slc.layer_thicknesses()[nn:len(slc)])-etchDepth,slc.layers[nn].cfseg)
-                            etched_layer_array += [etched_layer]
-                            etched_layer_array += [top_layer]
-                            self.etched_slices.append(Slice(etched_layer_array,slc.width,slc.etch))
-                            break
-                elif etchDepth == 0:
-                    if slc.layer_thicknesses()[len(slc)-1] == 0.0:
-                        del slc.layers[len(slc)-1]
-                    self.etched_slices.append(Slice(slc.layers,slc.width,slc.etch))
+            self.etched_slices = [_etch_slice(slc) for slc in args[0]]
                 
         if len(args) ==2:
             self.length = args[1]   # apply passed length
@@ -247,34 +323,28 @@ class Waveguide(Node):
 
     def get_width(self):
         '''Return total width of this Waveguide, by adding up width of each contained Slice.'''
-        wdth = 0.0
-        for slc in self.slices:
-            wdth += slc.width
-        return wdth
+        return math.fsum( slc.width for slc in self.slices )
     
     def width(self):
         '''Backwards compatibility only.  Should Instead get_width().'''
-        print "Deprecation Warning:  width():  Use get_width() instead."
-        return get_width()
+        warnings.warn( "width():  Use get_width() instead.", PyFIMMDeprecationWarning, stacklevel=2 )
+        return self.get_width()
 
     def get_slice_widths(self):
         '''Return widths of each Slice in this Waveguide.'''
-        slc_wdths = []
-        for slc in self.slices:
-            slc_wdths.append(slc.width)
-        return slc_wdths
+        return [slc.width for slc in self.slices]
     
     def slice_widths(self):
         '''Backwards compatibility only.  Should Instead get_slice_widths().'''
-        print "Deprecation Warning:  slice_widths():  Use get_slice_widths() instead."
-        return get_slice_widths(self)
+        warnings.warn( "slice_widths():  Use get_slice_widths() instead.", PyFIMMDeprecationWarning, stacklevel=2 )
+        return self.get_slice_widths()
     
     
 
     
     def mode(self,modeN):
         '''Waveguide.mode(int): Return the specified pyFimm Mode object for this waveguide.'''
-        return Mode(self, modeN,"app.subnodes[{"+str(self.parent.num)+"}].subnodes[{"+str(self.num)+"}].evlist.")
+        return Mode(self, modeN, "app.subnodes[{%i}].subnodes[{%i}].evlist." % (self.parent.num, self.num) )
 
 
     def calc(self,polish=False):
@@ -283,10 +353,11 @@ class Waveguide(Node):
         polish : polish modes if True, calculate modes as normal if False, optional
         '''
         if not self.built: self.buildNode()
+        evstr = "app.subnodes[{%i}].subnodes[{%i}].evlist" % (self.parent.num, self.num)
         if polish:
-            fimm.Exec("app.subnodes[{"+str(self.parent.num)+"}].subnodes[{"+str(self.num)+"}].evlist.polishevs")
+            fimm.Exec( evstr + ".polishevs" )
         else:
-            fimm.Exec("app.subnodes[{"+str(self.parent.num)+"}].subnodes[{"+str(self.num)+"}].evlist.update()")
+            fimm.Exec( evstr + ".update()" )
         
 
     def set_autorun(self):
@@ -347,7 +418,7 @@ class Waveguide(Node):
             self.__jointtype    # see if variable exists
         except AttributeError:
             # if the variable doesn't exist yet:
-            if DEBUG(): print "unset " + self.name + ".__jointtype --> 'complete'   "
+            log.debug( "unset %s.__jointtype --> 'complete'", self.name )
             self.__jointtype = 0
         
         if len(args) == 0:      asnumeric = False   # output as string by default
@@ -401,7 +472,7 @@ class Waveguide(Node):
     ####    Rectangular Waveguide Node Construction ####
     ####################################################
     
-    def buildNode(self, name=None, parent=None, overwrite=False, warn=True, update_node=False):
+    def buildNode(self, name=None, parent=None, overwrite=False, warn=True, update_node=False, batch=None):
         '''Build the Fimmwave node of this Ridge/Rectangular (RWG) waveguide.
         
         Parameters
@@ -420,34 +491,38 @@ class Waveguide(Node):
         
         update_node : {True | False}, optional
             False will create a new node and True re-builds the same node
+        
+        batch : int, optional
+            For very large waveguides: send the build commands to FimmWave in chunks of about this many characters while they are generated (see `FimmCommandStream`), instead of as one string.  By default everything is sent at once.
         '''
         if name: self.name = name
         if parent: self.parent = parent
-        if DEBUG(): print "Waveguide.buildNode(): self.parent.num=", self.parent.num
+        log.debug( "Waveguide.buildNode(): self.parent.num= %s", self.parent.num )
         
-        nodestring="app.subnodes["+str(self.parent.num)+"]"
+        nodestring = "app.subnodes[%i]" % self.parent.num
         
         if update_node:
-            node_num = self.num
+            wgString = ""
         else:
-            self._checkNodeName(nodestring, overwrite=overwrite, warn=warn)     # will alter the node name if needed
-            N_nodes = fimm.Exec(nodestring + ".numsubnodes()")
-            node_num = int(N_nodes+1)
-            wgString = self.parent.nodestring + ".addsubnode(rwguideNode,"+str(self.name)+")"+"\n"  # make RWG node
+            N_nodes = self._checkNodeName(nodestring, overwrite=overwrite, warn=warn)     # will alter the node name if needed
+            self.num = N_nodes + 1
+            wgString = "%s.addsubnode(rwguideNode,%s)\n" % (self.parent.nodestring, self.name)  # make RWG node
         
-        self.num = node_num    
-                
-        self.nodestring = self.parent.nodestring + ".subnodes["+str(self.num)+"]"
+        self.nodestring = "%s.subnodes[%i]" % (self.parent.nodestring, self.num)
         
-        if update_node:
-            fimm.Exec(  self.get_buildNode_str(self.nodestring, warn=warn, update_node=update_node)  )
+        if batch:
+            stream = FimmCommandStream(batch)
+            if wgString: stream.append(wgString)
+            self.get_buildNode_str(self.nodestring, warn=warn, update_node=update_node, stream=stream)
+            stream.flush()
         else:
-            fimm.Exec(  wgString + self.get_buildNode_str(self.nodestring, warn=warn, update_node=update_node)  )
+            # node creation & construction are sent in one Exec:
+            _exec_parts(  [wgString, self.get_buildNode_str(self.nodestring, warn=warn, update_node=update_node)]  )
         
         self.built=True
     #end buildNode()
     
-    def get_buildNode_str(self, nodestr, obj=None, target=None, warn=True, update_node=False):
+    def get_buildNode_str(self, nodestr, obj=None, target=None, warn=True, update_node=False, stream=None):
         '''Return the node construction string for either a standalone waveguide or device.
         This is for a Rectangular/Planar (RWG) waveguide.
         The new Waveguide subnode should be created BEFORE calling this function, so that you can pass the correct node string.
@@ -470,165 +545,142 @@ class Waveguide(Node):
         
         update_node : {True | False}, optional
             False will create a new node and True re-builds the same node
+        
+        stream : FimmCommandStream object, optional
+            If provided, the commands are appended to this stream as they are generated (and sent to FimmWave as it fills), and None is returned.  The caller should `flush()` the stream afterwards.
         '''
         
         if not obj: obj=self
         
+        # Re-use the string from an identical previous build, eg. in a parameter sweep:
+        key, rix_n = self._get_buildNode_key(nodestr, obj, target, update_node)
+        wgString = _BUILD_STR_CACHE.pop(key, None)
+        if wgString is not None:
+            _BUILD_STR_CACHE[key] = wgString    # re-insert as most recently used
+            if stream is None: return wgString
+            stream.append(wgString)
+            return None
+        
+        name = self.name
+        
         # build RWG Node
-        if DEBUG(): print "Waveguide: "+self.name+".__get_buildNode_str(): "
+        log.debug( "Waveguide: %s.__get_buildNode_str(): ", name )
         
         
         # check for custom material DB in this WG node.
-        if not self.__materialdb:
+        matDB = self.__materialdb
+        if not matDB:
             '''Use global material DB if this WG doesn't have a custom one set.'''
             matDB = get_material_database()
-        else:
-            matDB = self.__materialdb
-            #if DEBUG(): print "Using custom matDB: `%s`"%matDB
+        #else: if DEBUG(): print "Using custom matDB: `%s`"%matDB
         
         
         
-        wgString=""     # the string to return
+        if stream is None:
+            parts = []      # command lines, joined once on return
+        else:
+            parts = stream  # command lines are sent as the stream fills
         
         
         if matDB: 
             #if DEBUG(): print "setting MaterBase file to: '%s'"%matDB
-            wgString += nodestr + ".setmaterbase(" + matDB + ")  \n"
+            parts.append( nodestr + ".setmaterbase(" + matDB + ")  " )
         
         
-        sliceN = 1
-        for slc in obj.slices:
+        for sliceN, slc in enumerate(obj.slices, 1):
+            width, etch = slc.width, slc.etch
+            slc_prefix = "%s.slices[{%i}]" % (nodestr, sliceN)
+            layers = slc.layers
+            if etch <= 0 and layers and layers[-1].thickness == 0.0:
+                layers = layers[:-1]    # unetched slices don't build a zero-thickness top layer, see __init__
             if update_node:
-                wgString = nodestr + ".slices[{"+str(sliceN)+"}].width = "+str(slc.width)+"\n"
-                wgString += nodestr + ".slices[{"+str(sliceN)+"}].etch = "+str(slc.etch)+"\n"
+                parts.append( "%s.width = %s\n%s.etch = %s" % (slc_prefix, width, slc_prefix, etch) )
             else:
-                wgString += nodestr + ".insertslice({"+str(sliceN)+"})"+"\n"
-                wgString += nodestr + ".slices[{"+str(sliceN)+"}].width = "+str(slc.width)+"\n"
-                wgString += nodestr + ".slices[{"+str(sliceN)+"}].etch = "+str(slc.etch)+"\n"
-                wgString += (len(slc.layers)-1)*(nodestr + ".slices[{"+str(sliceN)+"}].insertlayer(1)"+"\n")
-            layerN = 1
-            for lyr in slc.layers:
-                wgString += nodestr + ".slices[{"+str(sliceN)+"}].layers[{"+str(layerN)+"}].size = "+str(lyr.thickness)+"\n"
+                parts.append( "%s.insertslice({%i})" % (nodestr, sliceN) )
+                parts.append( "%s.width = %s\n%s.etch = %s" % (slc_prefix, width, slc_prefix, etch) )
+                if len(layers) > 1:
+                    insert_line = slc_prefix + ".insertlayer(1)"
+                    parts.append( "\n".join( [insert_line]*(len(layers)-1) ) )
+            for layerN, lyr in enumerate(layers, 1):
+                lp = "%s.layers[{%i}]" % (slc_prefix, layerN)     # this layer's node string
+                parts.append( "%s.size = %r" % (lp, lyr.thickness) )
                 
-                if lyr.material.type == 'rix':
-                    wgString +=  nodestr + ".slices[{"+str(sliceN)+"}].layers[{"+str(layerN)+"}].nr11 = "+str(lyr.n())+"\n"+ \
-                        nodestr + ".slices[{"+str(sliceN)+"}].layers[{"+str(layerN)+"}].nr22 = "+str(lyr.n())+"\n"+ \
-                        nodestr + ".slices[{"+str(sliceN)+"}].layers[{"+str(layerN)+"}].nr33 = "+str(lyr.n())+"\n"
-                elif lyr.material.type == 'mat':
-                    if DEBUG(): print "Layer %i: mx="%(layerN), lyr.material.mx, " // my=", lyr.material.my
-                    wgString +=   nodestr + ".slices[{"+str(sliceN)+"}].layers[{"+str(layerN)+"}].setMAT(" + str(lyr.material.mat) + ") \n"
-                    if lyr.material.mx:   wgString +=  nodestr + ".slices[{"+str(sliceN)+"}].layers[{"+str(layerN)+"}].mx = "+str(lyr.material.mx)+"\n"
-                    if lyr.material.my:   wgString +=  nodestr + ".slices[{"+str(sliceN)+"}].layers[{"+str(layerN)+"}].my = "+str(lyr.material.my)+"\n"
+                emit_material = _LAYER_MATERIAL_EMITTERS.get( lyr.material.type )
+                if emit_material: emit_material(lp, lyr, parts, rix_n.get( id(lyr) ))
                 
                 if lyr.cfseg:
-                    wgString += nodestr + ".slices[{"+str(sliceN)+"}].layers[{"+str(layerN)+"}].cfseg = "+str(1)+"\n"
-                
-                
-                layerN += 1
-            sliceN += 1
+                    parts.append( lp + ".cfseg = 1" )
         #end for(slices)
 
+        # global boundary & PML settings, each read once:
+        boundaries = ( ('lhsbc', 'Left', get_left_boundary()), ('rhsbc', 'Right', get_right_boundary()), 
+                       ('botbc', 'Bottom', get_bottom_boundary()), ('topbc', 'Top', get_top_boundary()) )
+        x_pml, y_pml = get_x_pml(), get_y_pml()
+        
         # build boundary conditions - metal by default
-        if get_left_boundary() is None:
-            '''Default to Electric Wall/metal'''
-            if warn: print self.name + ".buildNode(): Left_Boundary: Using electric wall boundary."
-            wgString += nodestr + ".lhsbc.type = 1"+"\n"
-        else:
-            if get_left_boundary().lower() == 'metal' or get_left_boundary().lower() == 'electric wall':
-                wgString += nodestr + ".lhsbc.type = 1"+"\n"
-            elif get_left_boundary().lower() == 'magnetic wall':
-                wgString += nodestr + ".lhsbc.type = 2"+"\n"
-            elif get_left_boundary().lower() == 'periodic':
-                wgString += nodestr + ".lhsbc.type = 3"+"\n"
-            elif get_left_boundary().lower() == 'transparent':
-                wgString += nodestr + ".lhsbc.type = 4"+"\n"
-            elif get_left_boundary().lower() == 'impedance':
-                wgString += nodestr + ".lhsbc.type = 5"+"\n"
-            else:
-                print self.name + ".buildNode(): Invalid input to set_left_boundary()"
-                
-        if get_right_boundary() is None:
-            '''Default to Electric Wall/metal'''
-            if warn: print self.name + ".buildNode(): Right_Boundary: Using electric wall boundary."
-            wgString += nodestr + ".rhsbc.type = 1"+"\n"
-        else:
-            if get_right_boundary().lower() == 'metal' or get_right_boundary().lower() == 'electric wall':
-                wgString += nodestr + ".rhsbc.type = 1"+"\n"
-            elif get_right_boundary().lower() == 'magnetic wall':
-                wgString += nodestr + ".rhsbc.type = 2"+"\n"
-            elif get_right_boundary().lower() == 'periodic':
-                wgString += nodestr + ".rhsbc.type = 3"+"\n"
-            elif get_right_boundary().lower() == 'transparent':
-                wgString += nodestr + ".rhsbc.type = 4"+"\n"
-            elif get_right_boundary().lower() == 'impedance':
-                wgString += nodestr + ".rhsbc.type = 5"+"\n"
+        for side, label, bc in boundaries:
+            if bc is None:
+                # Default to Electric Wall/metal
+                if warn: log.warning( "%s.buildNode(): %s_Boundary: Using electric wall boundary.", name, label )
+                parts.append( nodestr + "." + side + ".type = 1" )
             else:
-                print self.name + ".buildNode(): Invalid input to set_right_boundary()"
-
-        if get_bottom_boundary() is None:
-            '''Default to Electric Wall/metal'''
-            if warn: print self.name + ".buildNode(): Bottom_Boundary: Using electric wall boundary."
-            wgString += nodestr + ".botbc.type = 1"+"\n"
-        else:
-            if get_bottom_boundary().lower() == 'metal' or get_bottom_boundary().lower() == 'electric wall':
-                wgString += nodestr + ".botbc.type = 1"+"\n"
-            elif get_bottom_boundary().lower() == 'magnetic wall':
-                wgString += nodestr + ".botbc.type = 2"+"\n"
-            elif get_bottom_boundary().lower() == 'periodic':
-                wgString += nodestr + ".botbc.type = 3"+"\n"
-            elif get_bottom_boundary().lower() == 'transparent':
-                wgString += nodestr + ".botbc.type = 4"+"\n"
-            elif get_bottom_boundary().lower() == 'impedance':
-                wgString += nodestr + ".botbc.type = 5"+"\n"
-            else:
-                print self.name + ".buildNode(): Invalid input to set_bottom_boundary()"
-
-        if get_top_boundary() is None:
-            '''Default to Electric Wall/metal'''
-            if warn: print self.name + ".buildNode(): Top_Boundary: Using electric wall boundary."
-            wgString += nodestr + ".topbc.type = 1"+"\n"
-        else:
-            if get_top_boundary().lower() == 'metal' or get_top_boundary().lower() == 'electric wall':
-                wgString += nodestr + ".topbc.type = 1"+"\n"
-            elif get_top_boundary().lower() == 'magnetic wall':
-                wgString += nodestr + ".topbc.type = 2"+"\n"
-            elif get_top_boundary().lower() == 'periodic':
-                wgString += nodestr + ".topbc.type = 3"+"\n"
-            elif get_top_boundary().lower() == 'transparent':
-                wgString += nodestr + ".topbc.type = 4"+"\n"
-            elif get_top_boundary().lower() == 'impedance':
-                wgString += nodestr + ".topbc.type = 5"+"\n"
-            else:
-                print self.name + ".buildNode(): Invalid input to set_top_boundary()"
-
-        if get_x_pml() is None:
-            '''Default to 0.0'''
-            wgString += nodestr + ".lhsbc.pmlpar = {0.0}"+"\n"+ \
-                        nodestr + ".rhsbc.pmlpar = {0.0}"+"\n"
-        else:
-            wgString += nodestr + ".lhsbc.pmlpar = {"+str(get_x_pml())+"}"+"\n"+ \
-                        nodestr + ".rhsbc.pmlpar = {"+str(get_x_pml())+"}"+"\n"
+                bctype = _BC_TYPES.get( bc.lower() )
+                if bctype is None:
+                    log.warning( "%s.buildNode(): Invalid input to set_%s_boundary()", name, label.lower() )
+                else:
+                    parts.append( nodestr + "." + side + ".type = " + str(bctype) )
+        #end for(boundaries)
 
-        if get_y_pml() is None:
-            '''Default to 0.0'''
-            wgString += nodestr + ".topbc.pmlpar = {0.0}"+"\n"+ \
-                        nodestr + ".botbc.pmlpar = {0.0}"+"\n"
-        else:
-            wgString += nodestr + ".topbc.pmlpar = {"+str(get_y_pml())+"}"+"\n"+ \
-                        nodestr + ".botbc.pmlpar = {"+str(get_y_pml())+"}"+"\n"
+        # PML widths, default to 0.0:
+        if x_pml is None: x_pml = 0.0
+        if y_pml is None: y_pml = 0.0
+        for side, pml in ( ('lhsbc', x_pml), ('rhsbc', x_pml), ('topbc', y_pml), ('botbc', y_pml) ):
+            parts.append( "%s.%s.pmlpar = {%s}" % (nodestr, side, pml) )
 
         
         
-        wgString += self.get_solver_str(nodestr, obj=obj, target=target)
+        parts.append( self.get_solver_str(nodestr, obj=obj, target=target) )
         
         
         #fimm.Exec(wgString)
         
+        if stream is not None: return None     # streamed commands aren't kept, so can't be cached
+        
+        wgString = "\n".join(parts)
+        if len(_BUILD_STR_CACHE) >= _BUILD_STR_CACHE_SIZE: _BUILD_STR_CACHE.popitem(last=False)
+        _BUILD_STR_CACHE[key] = wgString
         return wgString
 
     #end get_buildNodeStr()
     
     
+    def _get_buildNode_key(self, nodestr, obj, target, update_node):
+        '''Return a hashable signature of everything get_buildNode_str() output depends on: 
+        the node strings, the slice/layer geometry & materials, and the node & global solver settings.  
+        Also returns a dict of each 'rix' Layer's evaluated index `n()`, keyed by `id(layer)`, so the build doesn't call `n()` again.'''
+        layers_key = []
+        rix_n = {}
+        for slc in obj.slices:
+            for lyr in slc.layers:
+                mat = lyr.material
+                if mat.type == 'rix':
+                    if id(lyr) not in rix_n: rix_n[id(lyr)] = lyr.n()     # a Layer object may appear in several slices
+                    layers_key.append( (slc.width, slc.etch, lyr.thickness, lyr.cfseg, mat.type, rix_n[id(lyr)]) )
+                else:
+                    layers_key.append( (slc.width, slc.etch, lyr.thickness, lyr.cfseg, mat.type, mat.mat, mat.mx, mat.my) )
+            layers_key.append( None )       # slice separator
+        
+        settings_key = ( get_left_boundary(), get_right_boundary(), get_bottom_boundary(), get_top_boundary(), 
+                get_x_pml(), get_y_pml(), get_solver_speed(), get_horizontal_symmetry(), get_vertical_symmetry(), 
+                get_N(), get_NX(), get_NY(), get_min_TE_frac(), get_max_TE_frac(), get_min_EV(), get_max_EV(), 
+                get_RIX_tol(), get_N_1d(), get_mmatch(), get_mode_solver(), get_material_database() )
+        
+        key = ( nodestr, getattr(self, 'nodestring', None), target, update_node, tuple(layers_key), obj.bend_radius, 
+                self.__materialdb, self.autorun, self.__wavelength, settings_key )
+        return key, rix_n
+    #end _get_buildNode_key()
+    
+    
     
     def get_solver_str(self, nodestr, obj=None, target=None):
         ''' Return only the Solver ('svp') and mode solver (MOLAB, 'mpl') params for creating this node.
@@ -637,7 +689,7 @@ class Waveguide(Node):
 
         #if DEBUG(): print "Waveguide.get_solver_str()... "
         
-        wgString = ""
+        parts = []      # command lines, joined once on return
         
         # set solver parameters
         if target == 'wglens' or target == 'taper':
@@ -645,172 +697,75 @@ class Waveguide(Node):
             pass
         else:
             nodestr = nodestr + ".evlist"     #WG nodes set their solver params under this subheading
-            if obj.bend_radius == 0:
+            bend_radius = obj.bend_radius
+            if bend_radius == 0:
                 obj.bend_radius = inf
-                if warn: print self.name + ".buildNode(): Warning: bend_radius changed from 0.0 --> inf (straight waveguide)"
+                log.warning( "%s.buildNode(): Warning: bend_radius changed from 0.0 --> inf (straight waveguide)", self.name )
                 hcurv = 0
-            elif obj.bend_radius == inf:
+            elif bend_radius == inf:
                 hcurv = 0
             else:
-                hcurv = 1.0/obj.bend_radius
-            wgString += nodestr + ".svp.hcurv={"+str(hcurv)+"}"+"\n"
+                hcurv = 1.0/bend_radius
+            parts.append( nodestr + ".svp.hcurv={"+str(hcurv)+"}" )
         #end if(WGlens/Taper)
         
         
         #autorun & speed:
-        if self.autorun: 
-            wgString += nodestr + ".mlp.autorun=1"+"\n"
-        else:
-            wgString += nodestr + ".mlp.autorun=0"+"\n"
-        
-        
-        if get_solver_speed(): 
-            wgString += nodestr + ".mlp.speed=1"+"\n"    #0=best, 1=fast
-        else:
-            wgString += nodestr + ".mlp.speed=0"+"\n"    #0=best, 1=fast
+        parts.append( "%s.mlp.autorun=%i" % (nodestr, 1 if self.autorun else 0) )
+        parts.append( "%s.mlp.speed=%i" % (nodestr, 1 if get_solver_speed() else 0) )    #0=best, 1=fast
 
 
-        if get_horizontal_symmetry() is None:
-            wgString += nodestr + ".svp.hsymmetry=0"+"\n"
-        else:
-            if get_horizontal_symmetry() == 'none':
-                wgString += nodestr + ".svp.hsymmetry=0"+"\n"
-            elif get_horizontal_symmetry() == 'ExSymm':
-                wgString += nodestr + ".svp.hsymmetry=1"+"\n"
-            elif get_horizontal_symmetry() == 'EySymm':
-                wgString += nodestr + ".svp.hsymmetry=2"+"\n"
-            else:
-                print self.name + ".buildNode(): Invalid horizontal_symmetry. Please use: none, ExSymm, or EySymm"
-
-        if get_vertical_symmetry() is None:
-            wgString += nodestr + ".svp.vsymmetry=0"+"\n"
-        else:
-            if get_vertical_symmetry() == 'none':
-                wgString += nodestr + ".svp.vsymmetry=0"+"\n"
-            elif get_vertical_symmetry() == 'ExSymm':
-                wgString += nodestr + ".svp.vsymmetry=1"+"\n"
-            elif get_vertical_symmetry() == 'EySymm':
-                wgString += nodestr + ".svp.vsymmetry=2"+"\n"
+        symmetries = ( ('hsymmetry', 'horizontal', get_horizontal_symmetry()), ('vsymmetry', 'vertical', get_vertical_symmetry()) )
+        for attr, label, sym in symmetries:
+            symtype = _SYM_TYPES.get( sym )
+            if symtype is None:
+                log.warning( "%s.buildNode(): Invalid %s_symmetry. Please use: none, ExSymm, or EySymm", self.name, label )
             else:
-                print self.name + ".buildNode(): Invalid vertical_symmetry. Please use: none, ExSymm, or EySymm"
-
-        if get_N() is None:
-            '''Default to 10'''
-            wgString += nodestr + ".mlp.maxnmodes={10}"+"\n"
-        else:
-            wgString += nodestr + ".mlp.maxnmodes={"+str(get_N())+"}"+"\n"
-
-        if get_NX() is None:
-            '''Default to 60'''
-            wgString += nodestr + ".mlp.nx={60}"+"\n"
-            nx_svp = 60
-        else:
-            wgString += nodestr + ".mlp.nx={"+str(get_NX())+"}"+"\n"
-            nx_svp = get_NX()
-
-        if get_NY() is None:
-            '''Default to 60'''
-            wgString += nodestr + ".mlp.ny={60}"+"\n"
-            ny_svp = 60
-        else:
-            wgString += nodestr + ".mlp.ny={"+str(get_NY())+"}"+"\n"
-            ny_svp = get_NY()
-
-        if get_min_TE_frac() is None:
-            '''Default to 0.0'''
-            wgString += nodestr + ".mlp.mintefrac={0}"+"\n"
-        else:
-            wgString += nodestr + ".mlp.mintefrac={"+str(get_min_TE_frac())+"}"+"\n"
-        
-        if get_max_TE_frac() is None:
-            '''Default to 100.0'''
-            wgString += nodestr + ".mlp.maxtefrac={100}"+"\n"
-        else:
-            wgString += nodestr + ".mlp.maxtefrac={"+str(get_max_TE_frac())+"}"+"\n"
-        
-        if get_min_EV() is None:
-            '''Default to -1e50'''
-            wgString += nodestr + ".mlp.evend={-1e+050}"+"\n"
-        else:
-            wgStrint += nodestr + ".mlp.evend={"+str(get_min_EV())+"}"+"\n"
-        
-        if get_max_EV() is None:
-            '''Default to +1e50'''
-            wgString += nodestr + ".mlp.evstart={1e+050}"+"\n"
-        else:
-            wgStrint += nodestr + ".mlp.evend={"+str(get_max_EV())+"}"+"\n"
-
-        if get_RIX_tol() is None:
-            rix_svp = 0.010000
-        else:
-            rix_svp = get_RIX_tol()
-
-        if get_N_1d() is None:
-            n1d_svp = 30
-        else:
-            n1d_svp = get_N_1d()
-
-        if get_mmatch() is None:
-            mmatch_svp = 0
-        else:
-            mmatch_svp = get_mmatch()
-
-        if get_mode_solver() is None:
-            print  self.name + '.buildNode(): Using default mode solver: "vectorial FDM real"  '
-            wgString += nodestr + ".svp.solvid=71"+"\n"
-            solverString = nodestr + ".svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
-        else:
-            if get_mode_solver().lower() == 'vectorial FDM real'.lower():
-                wgString += nodestr + ".svp.solvid=71"+"\n"
-                solverString = nodestr + ".svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
-            elif get_mode_solver().lower() == 'semivecTE FDM real'.lower():
-                wgString += nodestr + ".svp.solvid=23"+"\n"
-                solverString = nodestr + ".svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
-            elif get_mode_solver().lower() == 'semivecTM FDM real'.lower():
-                wgString += nodestr + ".svp.solvid=39"+"\n"
-                solverString = nodestr + ".svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
-            elif get_mode_solver().lower() == 'vectorial FDM complex'.lower():
-                wgString += nodestr + ".svp.solvid=79"+"\n"
-                solverString = nodestr + ".svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
-            elif get_mode_solver().lower() == 'semivecTE FDM complex'.lower():
-                wgString += nodestr + ".svp.solvid=31"+"\n"
-                solverString = nodestr + ".svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
-            elif get_mode_solver().lower() == 'semivecTM FDM complex'.lower():
-                wgString += nodestr + ".svp.solvid=47"+"\n"
-                solverString = nodestr + ".svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
-            elif get_mode_solver().lower() == 'vectorial FMM real'.lower():
-                wgString += nodestr + ".svp.solvid=65"+"\n"
-                solverString = nodestr + ".svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
-            elif get_mode_solver().lower() == 'semivecTE FMM real'.lower():
-                wgString += nodestr + ".svp.solvid=17"+"\n"
-                solverString = nodestr + ".svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
-            elif get_mode_solver().lower() == 'semivecTM FMM real'.lower():
-                wgString += nodestr + ".svp.solvid=33"+"\n"
-                solverString = nodestr + ".svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
-            elif get_mode_solver().lower() == 'vectorial FMM complex'.lower():
-                wgString += nodestr + ".svp.solvid=73"+"\n"
-                solverString = nodestr + ".svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
-            elif get_mode_solver().lower() == 'semivecTE FMM complex'.lower():
-                wgString += nodestr + ".svp.solvid=25"+"\n"
-                solverString = nodestr + ".svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
-            elif get_mode_solver().lower() == 'semivecTM FMM complex'.lower():
-                wgString += nodestr + ".svp.solvid=41"+"\n"
-                solverString = nodestr + ".svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
-            else:
-                ErrStr = self.name + '.buildNode(): Invalid Modesolver String for Rectangular Waveguide (RWG): ' + str(get_mode_solver()) 
-                ErrStr += '\n Please see `help(pyfimm.set_mode_solver)`, and use one of the following:'
-                ErrStr += '\n   vectorial FDM real, semivecTE FDM real,semivecTM FDM real, '
-                ErrStr += '\n   vectorial FDM complex, semivecTE FDM complex , semivecTM FDM complex, '
-                ErrStr += '\n   vectorial FMM real, semivecTE FMM real, semivecTM FMM real, '
-                ErrStr += '\n   vectorial FMM complex, semivecTE FMM complex, or semivecTM FMM complex'
-                raise ValueError( ErrStr )
+                parts.append( "%s.svp.%s=%i" % (nodestr, attr, symtype) )
+        #end for(symmetries)
+
+        # mode-list settings, with defaults for any not set:
+        mlp = {}
+        for attr, getter, default in _MLP_FIELDS:
+            value = getter()
+            if value is None: value = default
+            mlp[attr] = value
+            parts.append( "%s.mlp.%s={%s}" % (nodestr, attr, value) )
+        #end for(_MLP_FIELDS)
+        nx_svp, ny_svp = mlp['nx'], mlp['ny']
+
+        # other global solver settings, each read once:
+        rix_svp, n1d_svp, mmatch_svp = get_RIX_tol(), get_N_1d(), get_mmatch()
+        solver_name = get_mode_solver()
+
+        if rix_svp is None:     rix_svp = 0.010000
+        if n1d_svp is None:     n1d_svp = 30
+        if mmatch_svp is None:  mmatch_svp = 0
+
+        if solver_name is None:
+            log.info( '%s.buildNode(): Using default mode solver: "vectorial FDM real"', self.name )
+            solver = 'vectorial fdm real'
+        else:
+            solver = solver_name.lower()
+        try:
+            solvid, buff = _SOLVER_TABLE[solver]
+        except KeyError:
+            ErrStr = self.name + '.buildNode(): Invalid Modesolver String for Rectangular Waveguide (RWG): ' + str(solver_name) 
+            ErrStr += '\n Please see `help(pyfimm.set_mode_solver)`, and use one of the following:'
+            ErrStr += '\n   vectorial FDM real, semivecTE FDM real,semivecTM FDM real, '
+            ErrStr += '\n   vectorial FDM complex, semivecTE FDM complex , semivecTM FDM complex, '
+            ErrStr += '\n   vectorial FMM real, semivecTE FMM real, semivecTM FMM real, '
+            ErrStr += '\n   vectorial FMM complex, semivecTE FMM complex, or semivecTM FMM complex'
+            raise ValueError( ErrStr )
+        parts.append( nodestr + ".svp.solvid=%i" % solvid )
+        solverString = _SOLVER_BUFF_TEMPLATES[buff] % {'ev':nodestr, 'nx':nx_svp, 'ny':ny_svp, 'rix':rix_svp, 'n1d':n1d_svp, 'mmatch':mmatch_svp}
         
         # Set wavelength:
-        wgString += self.nodestring + ".evlist.svp.lambda = %f \n"%(self.get_wavelength() )
+        parts.append( self.nodestring + ".evlist.svp.lambda = %f "%(self.get_wavelength() ) )
         
-        wgString += solverString
+        parts.append( solverString )
         
-        return wgString
+        return "\n".join(parts) + "\n"
         
         
     
@@ -831,12 +786,12 @@ class Waveguide(Node):
             provide the parent (Project/Device) Node object for this waveguide.'''
         if name: self.name = name
         if parentNode: self.parent = parentNode
-        if DEBUG(): print self.name + ".buildNode(): self.parent.num=", self.parent.num
+        log.debug( "%s.buildNode(): self.parent.num= %s", self.name, self.parent.num )
         
         N_nodes = fimm.Exec("app.subnodes["+str(self.parent.num)+"].numsubnodes()")
         node_num = int(N_nodes+1)
         self.num = node_num        
-        self.BuildRectNode()    
+        self.__BuildRectNode()
         self.built=True
     #end buildNode2()
     
@@ -846,112 +801,59 @@ class Waveguide(Node):
         
         NOTE: Not used anymore, replaced with get_buildNode_str()
         '''
+        x_pml, y_pml = get_x_pml(), get_y_pml()
+        
+        # node strings, built once:
+        parentstr = "app.subnodes[%i]" % self.parent.num
+        nodestr = "%s.subnodes[%i]" % (parentstr, self.num)
+        evstr = nodestr + ".evlist"
+        
         # build RWG
-        wgString = "app.subnodes["+str(self.parent.num)+"].addsubnode(rwguideNode,"+str(self.name)+")"+"\n"
-        sliceN = 1
-        for slc in self.slices:
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes[{"+str(self.num)+"}].insertslice({"+str(sliceN)+"})"+"\n"
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes[{"+str(self.num)+"}].slices[{"+str(sliceN)+"}].width = "+str(slc.width)+"\n"
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes[{"+str(self.num)+"}].slices[{"+str(sliceN)+"}].etch = "+str(slc.etch)+"\n"
-            wgString += (len(slc.layers)-1)*("app.subnodes["+str(self.parent.num)+"].subnodes[{"+str(self.num)+"}].slices[{"+str(sliceN)+"}].insertlayer(1)"+"\n")
-            layerN = 1
-            for lyr in slc.layers:
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes[{"+str(self.num)+"}].slices[{"+str(sliceN)+"}].layers[{"+str(layerN)+"}].size = "+str(lyr.thickness)+"\n"+ \
-                            "app.subnodes["+str(self.parent.num)+"].subnodes[{"+str(self.num)+"}].slices[{"+str(sliceN)+"}].layers[{"+str(layerN)+"}].nr11 = "+str(lyr.n())+"\n"+ \
-                            "app.subnodes["+str(self.parent.num)+"].subnodes[{"+str(self.num)+"}].slices[{"+str(sliceN)+"}].layers[{"+str(layerN)+"}].nr22 = "+str(lyr.n())+"\n"+ \
-                            "app.subnodes["+str(self.parent.num)+"].subnodes[{"+str(self.num)+"}].slices[{"+str(sliceN)+"}].layers[{"+str(layerN)+"}].nr33 = "+str(lyr.n())+"\n"
+        parts = [ "%s.addsubnode(rwguideNode,%s)\n" % (parentstr, self.name) ]
+        for sliceN, slc in enumerate(self.slices, 1):
+            slc_prefix = "%s.slices[{%i}]" % (nodestr, sliceN)
+            parts.append( "%s.insertslice({%i})\n%s.width = %s\n%s.etch = %s\n" % (nodestr, sliceN, slc_prefix, slc.width, slc_prefix, slc.etch) )
+            insert_line = slc_prefix + ".insertlayer(1)\n"
+            parts.extend( [insert_line]*(len(slc.layers)-1) )
+            for layerN, lyr in enumerate(slc.layers, 1):
+                lp = "%s.layers[{%i}]" % (slc_prefix, layerN)
+                n = str(lyr.n())
+                parts.append( "%s.size = %s\n%s.nr11 = %s\n%s.nr22 = %s\n%s.nr33 = %s\n" % (lp, lyr.thickness, lp, n, lp, n, lp, n) )
                 
                 if lyr.cfseg:
-                    wgString += "app.subnodes["+str(self.parent.num)+"].subnodes[{"+str(self.num)+"}].slices[{"+str(sliceN)+"}].layers[{"+str(layerN)+"}].cfseg = "+str(1)+"\n"
-                
-                
-                layerN += 1
-            sliceN += 1
+                    parts.append( lp+".cfseg = 1\n" )
+        #end for(slices)
 
         # build boundary conditions - metal by default
-        if get_left_boundary() is None:
-            '''Default to Electric Wall/metal'''
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].lhsbc.type = 1"+"\n"
-        else:
-            if left_boundary().lower() == 'metal' or left_boundary().lower() == 'electric wall':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].lhsbc.type = 1"+"\n"
-            elif left_boundary().lower() == 'magnetic wall':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].lhsbc.type = 2"+"\n"
-            elif left_boundary().lower() == 'periodic':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].lhsbc.type = 3"+"\n"
-            elif left_boundary().lower() == 'transparent':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].lhsbc.type = 4"+"\n"
-            elif left_boundary().lower() == 'impedance':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].lhsbc.type = 5"+"\n"
-            else:
-                print self.name + '.buildNode(): Invalid input to set_left_boundary()'
-                
-        if right_boundary() is None:
-            '''Default to Electric Wall/metal'''
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].rhsbc.type = 1"+"\n"
-        else:
-            if right_boundary().lower() == 'metal' or right_boundary().lower() == 'electric wall':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].rhsbc.type = 1"+"\n"
-            elif right_boundary().lower() == 'magnetic wall':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].rhsbc.type = 2"+"\n"
-            elif right_boundary().lower() == 'periodic':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].rhsbc.type = 3"+"\n"
-            elif right_boundary().lower() == 'transparent':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].rhsbc.type = 4"+"\n"
-            elif right_boundary().lower() == 'impedance':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].rhsbc.type = 5"+"\n"
-            else:
-                print self.name + '.buildNode(): Invalid input to set_right_boundary()'
-
-        if bottom_boundary() is None:
-            '''Default to Electric Wall/metal'''
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].botbc.type = 1"+"\n"
-        else:
-            if bottom_boundary().lower() == 'metal' or bottom_boundary().lower() == 'electric wall':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].botbc.type = 1"+"\n"
-            elif bottom_boundary().lower() == 'magnetic wall':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].botbc.type = 2"+"\n"
-            elif bottom_boundary().lower() == 'periodic':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].botbc.type = 3"+"\n"
-            elif bottom_boundary().lower() == 'transparent':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].botbc.type = 4"+"\n"
-            elif bottom_boundary().lower() == 'impedance':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].botbc.type = 5"+"\n"
+        boundaries = ( ('lhsbc', 'left', get_left_boundary()), ('rhsbc', 'right', get_right_boundary()), 
+                       ('botbc', 'bottom', get_bottom_boundary()), ('topbc', 'top', get_top_boundary()) )
+        for side, label, bc in boundaries:
+            if bc is None:
+                '''Default to Electric Wall/metal'''
+                bctype = 1
             else:
-                print self.name + '.buildNode(): Invalid input to set_bottom_boundary()'
-
-        if top_boundary() is None:
-            '''Default to Electric Wall/metal'''
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].topbc.type = 1"+"\n"
-        else:
-            if top_boundary().lower() == 'metal' or top_boundary().lower() == 'electric wall':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].topbc.type = 1"+"\n"
-            elif top_boundary().lower() == 'magnetic wall':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].topbc.type = 2"+"\n"
-            elif top_boundary().lower() == 'periodic':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].topbc.type = 3"+"\n"
-            elif top_boundary().lower() == 'transparent':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].topbc.type = 4"+"\n"
-            elif top_boundary().lower() == 'impedance':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].topbc.type = 5"+"\n"
+                bctype = _BC_TYPES.get( bc.lower() )
+            if bctype is None:
+                log.warning( "%s.buildNode(): Invalid input to set_%s_boundary()", self.name, label )
             else:
-                print self.name + '.buildNode(): Invalid input to set_top_boundary()'
+                parts.append( nodestr+"."+side+".type = "+str(bctype)+"\n" )
+        #end for(boundaries)
 
-        if pml_x() is None:
+        if x_pml is None:
             '''Default to 0.0'''
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].lhsbc.pmlpar = {0.0}"+"\n"+ \
-                        "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].rhsbc.pmlpar = {0.0}"+"\n"
+            parts.append( nodestr+".lhsbc.pmlpar = {0.0}"+"\n"+
+                        nodestr+".rhsbc.pmlpar = {0.0}"+"\n" )
         else:
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].lhsbc.pmlpar = {"+str(pml_x())+"}"+"\n"+ \
-                        "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].rhsbc.pmlpar = {"+str(pml_x())+"}"+"\n"
+            parts.append( nodestr+".lhsbc.pmlpar = {"+str(x_pml)+"}"+"\n"+
+                        nodestr+".rhsbc.pmlpar = {"+str(x_pml)+"}"+"\n" )
 
-        if pml_y() is None:
+        if y_pml is None:
             '''Default to 0.0'''
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].topbc.pmlpar = {0.0}"+"\n"+ \
-                        "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].botbc.pmlpar = {0.0}"+"\n"
+            parts.append( nodestr+".topbc.pmlpar = {0.0}"+"\n"+
+                        nodestr+".botbc.pmlpar = {0.0}"+"\n" )
         else:
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].topbc.pmlpar = {"+str(pml_y())+"}"+"\n"+ \
-                        "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].botbc.pmlpar = {"+str(pml_y())+"}"+"\n"
+            parts.append( nodestr+".topbc.pmlpar = {"+str(y_pml)+"}"+"\n"+
+                        nodestr+".botbc.pmlpar = {"+str(y_pml)+"}"+"\n" )
             
         # set solver parameters
         if self.bend_radius == 0:
@@ -959,148 +861,58 @@ class Waveguide(Node):
             hcurv = 0
         else:
             hcurv = 1.0/self.bend_radius
-        wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.hcurv={"+str(hcurv)+"}"+"\n"
+        parts.append( evstr+".svp.hcurv={"+str(hcurv)+"}"+"\n" )
 
-        wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.autorun=0"+"\n"
-        wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.speed=0"+"\n"
+        parts.append( evstr+".mlp.autorun=0"+"\n" )
+        parts.append( evstr+".mlp.speed=0"+"\n" )
 
 
-        if horizontal_symmetry() is None:
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.hsymmetry=0"+"\n"
-        else:
-            if horizontal_symmetry() == 'none':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.hsymmetry=0"+"\n"
-            elif horizontal_symmetry() == 'ExSymm':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.hsymmetry=1"+"\n"
-            elif horizontal_symmetry() == 'EySymm':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.hsymmetry=2"+"\n"
+        symmetries = ( ('hsymmetry', 'horizontal', get_horizontal_symmetry()), ('vsymmetry', 'vertical', get_vertical_symmetry()) )
+        for attr, label, sym in symmetries:
+            symtype = _SYM_TYPES.get( sym )
+            if symtype is None:
+                log.warning( "%s.buildNode(): Invalid %s_symmetry. Please use: none, ExSymm, or EySymm", self.name, label )
             else:
-                print self.name + '.buildNode(): Invalid horizontal_symmetry. Please use: none, ExSymm, or EySymm'
-
-        if vertical_symmetry() is None:
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.vsymmetry=0"+"\n"
-        else:
-            if vertical_symmetry() == 'none':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.vsymmetry=0"+"\n"
-            elif vertical_symmetry() == 'ExSymm':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.vsymmetry=1"+"\n"
-            elif vertical_symmetry() == 'EySymm':
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.vsymmetry=2"+"\n"
-            else:
-                print self.name + '.buildNode(): Invalid vertical_symmetry. Please use: none, ExSymm, or EySymm'
-
-        if N() is None:
-            '''Default to 10'''
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.maxnmodes={10}"+"\n"
-        else:
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.maxnmodes={"+str(N())+"}"+"\n"
-
-        if get_NX() is None:
-            '''Default to 60'''
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.nx={60}"+"\n"
-            nx_svp = 60
-        else:
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.nx={"+str(NX())+"}"+"\n"
-            nx_svp = get_NX()
-
-        if get_NY() is None:
-            '''Default to 60'''
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.ny={60}"+"\n"
-            ny_svp = 60
-        else:
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.ny={"+str(NY())+"}"+"\n"
-            ny_svp = get_NY()
-
-        if min_TE_frac() is None:
-            '''Default to 0.0'''
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.mintefrac={0}"+"\n"
-        else:
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.mintefrac={"+str(min_TE_frac())+"}"+"\n"
-        
-        if max_TE_frac() is None:
-            '''Default to 100.0'''
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.maxtefrac={100}"+"\n"
-        else:
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.maxtefrac={"+str(max_TE_frac())+"}"+"\n"
-        
-        if min_EV() is None:
-            '''Default to -1e50'''
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.evend={-1e+050}"+"\n"
-        else:
-            wgStrint += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.evend={"+str(min_EV())+"}"+"\n"
-        
-        if max_EV() is None:
-            '''Default to +1e50'''
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.evstart={1e+050}"+"\n"
-        else:
-            wgStrint += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.mlp.evend={"+str(max_EV())+"}"+"\n"
-
-        if RIX_tol() is None:
-            rix_svp = 0.010000
-        else:
-            rix_svp = RIX_tol()
-
-        if N_1d() is None:
-            n1d_svp = 30
-        else:
-            n1d_svp = N_1d()
-
-        if mmatch() is None:
-            mmatch_svp = 0
-        else:
-            mmatch_svp = mmatch()
-
-        if mode_solver() is None:
-            print 'Using default mode solver: "vectorial FDM real"  '
-            wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.solvid=71"+"\n"
-            solverString = "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
-        else:
-            if get_mode_solver().lower() == 'vectorial FDM real'.lower():
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.solvid=71"+"\n"
-                solverString = "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
-            elif get_mode_solver().lower() == 'semivecTE FDM real'.lower():
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.solvid=23"+"\n"
-                solverString = "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
-            elif get_mode_solver().lower() == 'semivecTM FDM real'.lower():
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.solvid=39"+"\n"
-                solverString = "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
-            elif get_mode_solver().lower() == 'vectorial FDM complex'.lower():
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.solvid=79"+"\n"
-                solverString = "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
-            elif get_mode_solver().lower() == 'semivecTE FDM complex'.lower():
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.solvid=31"+"\n"
-                solverString = "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
-            elif get_mode_solver().lower() == 'semivecTM FDM complex'.lower():
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.solvid=47"+"\n"
-                solverString = "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.buff=V1 "+str(nx_svp)+" "+str(ny_svp)+" 0 100 "+str(rix_svp)+"\n"
-            elif get_mode_solver().lower() == 'vectorial FMM real'.lower():
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.solvid=65"+"\n"
-                solverString = "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
-            elif get_mode_solver().lower() == 'semivecTE FMM real'.lower():
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.solvid=17"+"\n"
-                solverString = "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
-            elif get_mode_solver().lower() == 'semivecTM FMM real'.lower():
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.solvid=33"+"\n"
-                solverString = "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
-            elif get_mode_solver().lower() == 'vectorial FMM complex'.lower():
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.solvid=73"+"\n"
-                solverString = "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
-            elif get_mode_solver().lower() == 'semivecTE FMM complex'.lower():
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.solvid=25"+"\n"
-                solverString = "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
-            elif get_mode_solver().lower() == 'semivecTM FMM complex'.lower():
-                wgString += "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.solvid=41"+"\n"
-                solverString = "app.subnodes["+str(self.parent.num)+"].subnodes["+str(self.num)+"].evlist.svp.buff=V2 "+str(n1d_svp)+" "+str(mmatch_svp)+" 1 300 300 15 25 0 5 5"+"\n"
-            else:
-                print 'Invalid Rectangular Mode Solver. Please see `help(pyfimm.set_mode_solver)`, and use one of the following:'
-                print 'vectorial FDM real, semivecTE FDM real,semivecTM FDM real, '
-                print 'vectorial FDM complex, semivecTE FDM complex , semivecTM FDM complex, '
-                print 'vectorial FMM real, semivecTE FMM real, semivecTM FMM real, '
-                print 'vectorial FMM complex, semivecTE FMM complex, or semivecTM FMM complex'
-                raise ValueError("Invalid Modesolver String: " + str(get_mode_solver()) )
-
-        wgString += solverString
-        fimm.Exec(wgString)
+                parts.append( "%s.svp.%s=%i\n" % (evstr, attr, symtype) )
+        #end for(symmetries)
+
+        # mode-list settings, with defaults for any not set:
+        mlp = {}
+        for attr, getter, default in _MLP_FIELDS:
+            value = getter()
+            if value is None: value = default
+            mlp[attr] = value
+            parts.append( "%s.mlp.%s={%s}\n" % (evstr, attr, value) )
+        #end for(_MLP_FIELDS)
+        nx_svp, ny_svp = mlp['nx'], mlp['ny']
+
+        # other global solver settings, each read once:
+        rix_svp, n1d_svp, mmatch_svp = get_RIX_tol(), get_N_1d(), get_mmatch()
+        solver_name = get_mode_solver()
+
+        if rix_svp is None:     rix_svp = 0.010000
+        if n1d_svp is None:     n1d_svp = 30
+        if mmatch_svp is None:  mmatch_svp = 0
+
+        if solver_name is None:
+            log.info( '%s.buildNode(): Using default mode solver: "vectorial FDM real"', self.name )
+            solver = 'vectorial fdm real'
+        else:
+            solver = solver_name.lower()
+        if solver not in _SOLVER_TABLE:
+            ErrStr = self.name + '.buildNode(): Invalid Modesolver String: ' + str(solver_name)
+            ErrStr += '\n Please see `help(pyfimm.set_mode_solver)`, and use one of the following:'
+            ErrStr += '\n   vectorial FDM real, semivecTE FDM real,semivecTM FDM real, '
+            ErrStr += '\n   vectorial FDM complex, semivecTE FDM complex , semivecTM FDM complex, '
+            ErrStr += '\n   vectorial FMM real, semivecTE FMM real, semivecTM FMM real, '
+            ErrStr += '\n   vectorial FMM complex, semivecTE FMM complex, or semivecTM FMM complex'
+            raise ValueError( ErrStr )
+        solvid, buff = _SOLVER_TABLE[solver]
+        parts.append( evstr+".svp.solvid="+str(solvid)+"\n" )
+        solverString = _SOLVER_BUFF_TEMPLATES[buff] % {'ev':evstr, 'nx':nx_svp, 'ny':ny_svp, 'rix':rix_svp, 'n1d':n1d_svp, 'mmatch':mmatch_svp} + "\n"
+
+        parts.append( solverString )
+        _exec_parts( parts )
 
     #end buildRect()
 
@@ -1119,202 +931,91 @@ class Waveguide(Node):
 ###################################################
 '''
 
+# PML widths in X & Y, None until set:
+_PML_WIDTHS = {'x':None, 'y':None}
+
+# Boundary types of each side, None until set:
+_BOUNDARIES = {'top':None, 'bottom':None, 'left':None, 'right':None}
+
 def set_x_pml(pml_x):
     '''Set length of Perfectly-Matched Layer in X (horizontal) direction.'''
-    global global_horizontal_pml
-    global_horizontal_pml = pml_x
-
-def set_pml_x(w):
-    '''Backwards compatibility only.  Should instead use set_x_pml.'''
-    print "Deprecation Warning:  set_pml_x():  Use set_x_pml() instead."
-    set_x_pml(w)
+    _PML_WIDTHS['x'] = pml_x
 
 def get_x_pml():
     '''Get length of Perfectly-Matched Layer in horizontal direction (X). Returns None if not set.'''
-    global global_horizontal_pml
-    try:
-        global_horizontal_pml
-    except NameError:
-        global_horizontal_pml = None
-    return global_horizontal_pml
-
-def get_pml_x():
-    '''Backwards compatibility only.  Should instead use get_circ_pml.'''
-    print "Deprecation Warning:  get_pml_x():  Use get_x_pml() instead."
-    return get_x_pml()
-
-def pml_x():
-    '''Backwards compatibility only. 
-    Please use get_***() instead.'''
-    print "DeprecationWarning: Use get_x_pml() instead."
-    return get_x_pml()
+    return _PML_WIDTHS['x']
 
 
 
 def set_y_pml(pml_y):
     '''Set length of Perfectly-Matched Layer in Y (vertical) direction.'''
-    global global_vertical_pml
-    global_vertical_pml = pml_y
-
-def set_pml_x(w):
-    '''Backwards compatibility only.  Should instead use set_y_pml.'''
-    print "Deprecation Warning:  set_pml_y():  Use set_y_pml() instead."
-    set_y_pml(w)
+    _PML_WIDTHS['y'] = pml_y
 
 def get_y_pml():
     '''Get length of Perfectly-Matched Layer in vertical direction (Y). Returns None if not set.'''
-    global global_vertical_pml
-    try:
-        global_vertical_pml
-    except NameError:
-        global_vertical_pml = None
-    return global_vertical_pml
-
-def get_pml_y():
-    '''Backwards compatibility only.  Should instead use get_y_pml.'''
-    print "Deprecation Warning:  get_pml_y():  Use get_y_pml() instead."
-    return get_y_pml()
-
-def pml_y():
-    '''Backwards compatibility only. 
-    Please use get_***() instead.'''
-    print "DeprecationWarning: Use get_y_pml() instead."
-    return get_y_pml()
+    return _PML_WIDTHS['y']
 
 
 
-def set_top_boundary(bndry):
-    '''Set boundary type of top side of rectangular waveguide.
-    
-    Parameters
-    ----------
-    bndry : string { 'metal' | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' }
-    '''
-    possibleArgs = ['metal' , 'magnetic wall' , 'periodic' , 'transparent' , 'impedance']
-    exists = len(   np.where(  np.array( type ) == np.array( possibleArgs)  )[0]   )
-    if not exists: raise ValueError("Allowed arguments are: 'metal' | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' ")
-    global global_TBC
-    global_TBC = bndry
+def _check_boundary(bndry, side):
+    '''Raise ValueError if `bndry` is not a boundary type accepted by set_`side`_boundary().'''
+    if str(bndry).lower() not in _BC_TYPES:
+        ErrStr = "set_%s_boundary(): Invalid boundary type %r.  Allowed arguments are: '%s'" % (side, bndry, "' | '".join(sorted(_BC_TYPES)))
+        raise ValueError(ErrStr)
 
-def get_top_boundary():
-    '''Get boundary type of top side of waveguides.
-    
-    Returns
-    -------
-    type : string { 'metal' | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' }
-    '''
-    global global_TBC
-    try:
-        global_TBC
-    except NameError:
-        global_TBC = None
-    return global_TBC
-
-def top_boundary():
-    '''Backwards compatibility only.  Should Instead get_top_boundary().'''
-    print "Deprecation Warning:  top_boundary():  Use get_top_boundary() instead."
-    return get_top_boundary()
-
-
-
-def set_bottom_boundary(bndry):
-    '''Set boundary type of bottom side of rectangular waveguide.
+def _boundary_funcs(side):
+    '''Return the (setter, getter) functions for the boundary type of the `side` side of rectangular waveguides.'''
+    def setter(bndry):
+        _check_boundary(bndry, side)
+        _BOUNDARIES[side] = bndry
+    setter.__name__ = 'set_%s_boundary' % side
+    setter.__doc__ = '''Set boundary type of %s side of rectangular waveguide.
     
     Parameters
     ----------
     bndry : string { 'metal' | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' }
-    '''
-    possibleArgs = ['metal' , 'magnetic wall' , 'periodic' , 'transparent' , 'impedance']
-    exists = len(   np.where(  np.array( type ) == np.array( possibleArgs)  )[0]   )
-    if not exists: raise ValueError("Allowed arguments are: 'metal' | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' ")
-    global global_BBC
-    global_BBC = bndry
-
-def get_bottom_boundary():
-    '''Get boundary type of top side of waveguides.
-    
-    Returns
-    -------
-    type : string { 'metal' | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' }
-    '''
-    global global_BBC
-    try:
-        global_BBC
-    except NameError:
-        global_BBC = None
-    return global_BBC
+    ''' % side
     
-def bottom_boundary():
-    '''Backwards compatibility only.  Should Instead get_bottom_boundary().'''
-    print "Deprecation Warning:  bottom_boundary():  Use get_bottom_boundary() instead."
-    return get_bottom_boundary()
-
-
-
-def set_left_boundary(bndry):
-    '''Set boundary type of left side of rectangular waveguide.
-    
-    Parameters
-    ----------
-    bndry : string { 'metal' | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' }
-    '''
-    possibleArgs = ['metal' , 'magnetic wall' , 'periodic' , 'transparent' , 'impedance']
-    exists = len(   np.where(  np.array( type ) == np.array( possibleArgs)  )[0]   )
-    if not exists: raise ValueError("Allowed arguments are: 'metal' | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' ")
-    global global_LBC
-    global_LBC = bndry
-
-def get_left_boundary():
-    '''Get boundary type of top side of waveguides.
-    
-    Returns
-    -------
-    type : string { 'metal' | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' }
-    '''
-    global global_LBC
-    try:
-        global_LBC
-    except NameError:
-        global_LBC = None
-    return global_LBC
-    
-def left_boundary():
-    '''Backwards compatibility only.  Should Instead get_left_boundary().'''
-    print "Deprecation Warning:  left_boundary():  Use get_left_boundary() instead."
-    return get_left_boundary()
-
-
-
-def set_right_boundary(bndry):
-    '''Set boundary type of right side of rectangular waveguide.
-    
-    Parameters
-    ----------
-    bndry : string { 'metal' | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' }
-    '''
-    possibleArgs = ['metal' , 'magnetic wall' , 'periodic' , 'transparent' , 'impedance']
-    exists = len(   np.where(  np.array( type ) == np.array( possibleArgs)  )[0]   )
-    if not exists: raise ValueError("Allowed arguments are: 'metal' | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' ")
-    global global_RBC
-    global_RBC = bndry
-
-def get_right_boundary():
-    '''Get boundary type of top side of waveguides.
+    def getter():
+        return _BOUNDARIES[side]
+    getter.__name__ = 'get_%s_boundary' % side
+    getter.__doc__ = '''Get boundary type of %s side of rectangular waveguides.  Returns None if not set.
     
     Returns
     -------
     type : string { 'metal' | 'magnetic wall' | 'periodic' | 'transparent' | 'impedance' }
-    '''
-    global global_RBC
-    try:
-        global_RBC
-    except NameError:
-        global_RBC = None
-    return global_RBC
-    
-def right_boundary():
-    '''Backwards compatibility only.  Should Instead get_right_boundary().'''
-    print "Deprecation Warning:  right_boundary():  Use get_right_boundary() instead."
-    return get_right_boundary()
-
-
+    ''' % side
+    return setter, getter
+#end _boundary_funcs()
+
+set_top_boundary, get_top_boundary = _boundary_funcs('top')
+set_bottom_boundary, get_bottom_boundary = _boundary_funcs('bottom')
+set_left_boundary, get_left_boundary = _boundary_funcs('left')
+set_right_boundary, get_right_boundary = _boundary_funcs('right')
+
+
+
+# Backwards-compatible names for the functions above:
+_deprecation_warned = set()     # aliases that have already issued their warning
+
+def _deprecated(alias, target):
+    '''Return a function named `alias` that calls `target`, warning (once only) that `alias` is deprecated.'''
+    def wrapper(*args, **kwargs):
+        if alias not in _deprecation_warned:
+            _deprecation_warned.add(alias)
+            warnings.warn( "%s():  Use %s() instead." % (alias, target.__name__), PyFIMMDeprecationWarning, stacklevel=2 )
+        return target(*args, **kwargs)
+    wrapper.__name__ = alias
+    wrapper.__doc__ = '''Backwards compatibility only.  Should instead use %s().''' % target.__name__
+    return wrapper
+
+set_pml_x = _deprecated('set_pml_x', set_x_pml)
+get_pml_x = _deprecated('get_pml_x', get_x_pml)
+pml_x = _deprecated('pml_x', get_x_pml)
+set_pml_y = _deprecated('set_pml_y', set_y_pml)
+get_pml_y = _deprecated('get_pml_y', get_y_pml)
+pml_y = _deprecated('pml_y', get_y_pml)
+top_boundary = _deprecated('top_boundary', get_top_boundary)
+bottom_boundary = _deprecated('bottom_boundary', get_bottom_boundary)
+left_boundary = _deprecated('left_boundary', get_left_boundary)
+right_boundary = _deprecated('right_boundary', get_right_boundary)
@@ -5,101 +5,98 @@ This separate file is required to prevent circular module imports, and enable ne
 '''
 
 import numpy as np
-import matplotlib.pyplot as plt
-
-'''
-## The following were various tests for resolving cyclic imports - can probably be deleted
-
-# import some pyFIMM objects/functions for global access from within the module:
-## for Mode.py:
-import pylab as pl
-#import matplotlib.pyplot as plt
-from pylab import cm    # color maps
-#import numpy as np
-import math
-import os  # for filepath manipulations (os.path.join/os.mkdir/os.path.isdir)
-from __pyfimm import get_N, get_wavelength
-
-## For Device.py
-from __pyfimm import Node, Project, Material, Layer, Slice
-from __Waveguide import Waveguide   # rectangular waveguide class
-from __Circ import Circ        # cylindrical (fiber) waveguide class
-from __Tapers import Taper, Lens      # import Taper/WGLens classes
-from __Mode import Mode     # import Mode class
-
-
-## for pyfimm.py:
-from __Device import Device     # Device class
-#import numpy as np
-import datetime as dt   # for date/time strings
-import os.path      # for path manipulation
-import random       # random number generators
-
-## for Waveguide.py & Circ.py:
-from numpy import inf           # infinity, for hcurv/bend_radius
-#from __pyfimm import *          # all global modesolver params.
-
-## for Tapers.py:
-#from __pyfimm import *       # import the main module (should already be imported), includes many 'rect' classes/funcs
-#from __Mode import *            # import Mode class
-#from __Waveguide import *       # import Waveguide class
-#from __Circ import *            # import Circ class
-#from __pyfimm import DEBUG()        # Value is set in __pyfimm.py
-#from numpy import inf              # infinity, for hcurv/bend_radius
-#import numpy as np              # math
-'''
 
 #print "**** __globals.py: Finished importing pyFIMM modules"
 
-global pf_DEBUG
 pf_DEBUG = False   # set to true for verbose outputs onto Python console - applies to all submodules/files
 # can be changed at run-time via `set/unset_DEBUG()`
 
-global pf_WARN
 pf_WARN = True      # globally set warning mode
 
-# custom colormaps:
-from colormap_HotCold import cm_hotcold
-
+# Package logger, for modules that report via `logging` rather than `print`.  
+# Prints bare messages to the console like `print` does; DEBUG-level messages are enabled by `set_DEBUG()`.
+import logging, sys
+pf_log = logging.getLogger('pyfimm')
+if not pf_log.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter( logging.Formatter('%(message)s') )
+    pf_log.addHandler(_handler)
+    pf_log.propagate = False    # avoid duplicate output if the root logger is also configured
+pf_log.setLevel( logging.DEBUG if pf_DEBUG else logging.INFO )
+
+# Warning category for pyFIMM's deprecated functions.  Python 2.7 hides DeprecationWarning by default, 
+# so this subclass is shown (once per calling location) unless the user's own warning filters say otherwise:
+import warnings
+class PyFIMMDeprecationWarning(DeprecationWarning):
+    '''Issued when a deprecated pyFIMM function is called.'''
+    pass
+warnings.simplefilter('default', PyFIMMDeprecationWarning)
+
+# custom colormaps, only imported (along with matplotlib) when a plot needs them:
+def get_cm_hotcold():
+    '''Return the red-black-blue `cm_hotcold` colormap, from colormap_HotCold.py.'''
+    from colormap_HotCold import cm_hotcold     # Python caches imported modules, so this is only built once
+    return cm_hotcold
+
+
+# FimmWave connection object.
+class _LazyFimm(object):
+    '''Stands in for the pdPythonLib `pdApp` connection object, which is only imported & created when first used.  
+    So merely importing pyFIMM (eg. for documentation) doesn't need PhotonDesignLib or a connection.'''
+    def __init__(self):
+        self._app = None
+    
+    def __getattr__(self, name):
+        '''Pass everything else, eg. `Exec()` & `ConnectToApp()`, to the pdApp object.'''
+        if self._app is None:
+            import PhotonDesignLib.pdPythonLib as pd
+            self._app = pd.pdApp()
+        return getattr(self._app, name)
+    
+    def _reset(self):
+        '''Delete the pdApp object, closing its connection.  A new one is created when next used.'''
+        self._app = None    # pdPythonLib does some cleanup upon del()'ing
+#end class _LazyFimm
 
-# Create FimmWave connection object.
-import PhotonDesignLib.pdPythonLib as pd
 global fimm
-fimm = pd.pdApp()   # used in all scripts to send commands, via `fimm.Exec('CommandsToSend')`
+fimm = _LazyFimm()  # used in all scripts to send commands, via `fimm.Exec('CommandsToSend')`
 pdApp = fimm        # alias to the above.
 
 
 
 
-#  These override the value set above in `pf_DEBUG`
+#  The current DEBUG & WARN settings are kept on the DEBUG() & WARN() functions, as `DEBUG.value` & `WARN.value`.
+#  These override the initial values set above in `pf_DEBUG` & `pf_WARN`.
 def set_DEBUG():
     '''Enable verbose output for debugging.'''
-    global pf_DEBUG
-    pf_DEBUG = True
+    DEBUG.value = True
+    pf_log.setLevel(logging.DEBUG)
 
 def unset_DEBUG():
     '''Disable verbose debugging output.'''
-    global pf_DEBUG
-    pf_DEBUG = False
+    DEBUG.value = False
+    pf_log.setLevel(logging.INFO)
 
 def DEBUG():
-    '''Returns whether DEBUG is true or false'''
-    return pf_DEBUG
+    '''Returns whether DEBUG is true or false.  
+    The same value is kept in `DEBUG.value`, for loops to read once beforehand.'''
+    return DEBUG.value
+DEBUG.value = pf_DEBUG
 
 # the global WARN is not currently implemented in the main functions yet.
 def set_WARN():
     '''Enable verbose output for debugging.'''
-    global pf_WARN
-    pf_WARN = True
+    WARN.value = True
 
 def unset_WARN():
     '''Disable verbose debugging output.'''
-    global pf_WARN
-    pf_WARN = False
+    WARN.value = False
 
 def WARN():
-    '''Returns whether WARN is true or false'''
-    return pf_WARN
+    '''Returns whether WARN is true or false.  
+    The same value is kept in `WARN.value`, for loops to read once beforehand.'''
+    return WARN.value
+WARN.value = pf_WARN
 
 def AMF_FolderStr():
     '''Folder name to store temporary files in.'''
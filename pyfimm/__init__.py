@@ -102,29 +102,50 @@ after strip.calc(), try
 
 '''
 
+from __future__ import print_function     # print() calls, which also compile under Python 3
+
 import __version as v    # file with the version number.
 version = v.versionnum
 versiondate = v.versiondate
 
-# Splash screen.
-print
-print "pyFIMM", v.version, ""
-print "Python Interface to Photon Design's FIMMWave software package."
-print "Based on Peter Beinstman's CAMFR (CAvity Modelling FRamework) interface."
-print
-print "Created by Jared Bauters University of California, Santa Barbara & updated by Demis D. John."
-print
+def splash():
+    '''Print the pyFIMM splash screen: version & credits.  
+    Shown on import only if the environment variable PYFIMM_SPLASH is set to 1.'''
+    print("")
+    print("pyFIMM", v.version, "")
+    print("Python Interface to Photon Design's FIMMWave software package.")
+    print("Based on Peter Beinstman's CAMFR (CAvity Modelling FRamework) interface.")
+    print("")
+    print("Created by Jared Bauters University of California, Santa Barbara & updated by Demis D. John.")
+    print("")
+
+import os
+if os.environ.get('PYFIMM_SPLASH', '0') == '1': splash()
 
 
 from __globals import *         # import global vars & FimmWave connection object
 from __pyfimm import *          # import the main module, many global functions, base objects like Project, Material, Slice, Section and some rectangular waveguide functions.
-from __Waveguide import *       # contains the Waveguide class, including most of the Fimmwave commands for WG creation.
-from __Circ import *            # contains Circ class & all other functions for cylindrical geometries.
-from __Device import *          # contains the Device class, for constructing 3-D devices 
-from __Mode import *            # contains the Mode class, for WGobj.mode(0).xyz operations
-from __Tapers import *          # contains all Taper classes, including WG_Lens
-from __Cavity import *          # Cavity object & calculations
-from __CavityMode import *      # contains the CavityMode class, for CavityOb.mode(0).xyz operations
+
+# The remaining modules' public names are listed explicitly, rather than `import *`-ing each module's helper imports too:
+
+# the Waveguide class, including most of the Fimmwave commands for WG creation, & the global rectangular-WG parameters:
+from __Waveguide import Waveguide, \
+    set_x_pml, get_x_pml, set_y_pml, get_y_pml, \
+    set_top_boundary, get_top_boundary, set_bottom_boundary, get_bottom_boundary, \
+    set_left_boundary, get_left_boundary, set_right_boundary, get_right_boundary, \
+    set_pml_x, get_pml_x, pml_x, set_pml_y, get_pml_y, pml_y, \
+    top_boundary, bottom_boundary, left_boundary, right_boundary
+
+# Circ class & all other functions for cylindrical geometries:
+from __Circ import Circ, \
+    set_circ_pml, get_circ_pml, set_pml_circ, get_pml_circ, \
+    set_circ_boundary, get_circ_boundary, set_Nm, get_Nm, set_Np, get_Np
+
+from __Device import Device, import_device     # the Device class, for constructing 3-D devices 
+from __Mode import Mode                 # the Mode class, for WGobj.mode(0).xyz operations
+from __Tapers import Taper, Lens        # all Taper classes, including WG_Lens
+from __Cavity import Cavity             # Cavity object & calculations
+from __CavityMode import CavityMode     # the CavityMode class, for CavityOb.mode(0).xyz operations
 
 
 ####################################################################################
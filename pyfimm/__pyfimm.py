@@ -41,6 +41,8 @@ from __Classes import *         # import higher-level classes
 #import numpy as np
 #import datetime as dt   # for date/time strings
 import os.path      # for path manipulation
+import re           # RegEx module, for parsing AMF files
+from cStringIO import StringIO  # FimmCommandStream buffer
 
 
 
@@ -73,8 +75,7 @@ def connect(hostname='localhost', port=5101):
     
 def disconnect():
     '''Terminate the connection to the FimmWave Application & delete the object.'''
-    global pd # use this module-level variable.  Dunno why the `global` declaration is only needed in THIS module function (not others!), in order to delete it...
-    del pd    # pdPythonLib does some cleanup upon del()'ing
+    fimm._reset()     # deletes the pdPythonLib object, which does some cleanup upon del()'ing
 
 def exitfimmwave():
     '''Closes the Fimmwave app'''
@@ -92,6 +93,40 @@ def Exec(string, vars=[]):
     return out
 
 
+class FimmCommandStream(object):
+    '''Collects FimmWave command lines and sends them to FimmWave in batches of roughly `batch` characters, rather than as one giant string.
+    
+    Used by `Waveguide.buildNode(batch=...)`, so that the build commands are sent while they are still being generated.
+    
+    Parameters
+    ----------
+    batch : int, optional
+        Send the collected commands once they exceed this many characters.  Defaults to 64kB.
+    
+    Examples
+    --------
+    >>> stream = FimmCommandStream()
+    >>> stream.append( "app.subnodes[1].subnodes[2].slices[{1}].width = 2.0" )
+    >>> stream.flush()      # send any remaining commands
+    '''
+    def __init__(self, batch=64*1024):
+        self.batch = batch
+        self.buf = StringIO()   # written straight into, so no join is needed when sending
+    
+    def append(self, cmd):
+        '''Add one or more (newline-separated) command lines, sending the batch if it is full.'''
+        self.buf.write( cmd.rstrip("\n") )
+        self.buf.write( "\n" )
+        if self.buf.tell() > self.batch: self.flush()
+    
+    def flush(self):
+        '''Send all collected commands to FimmWave.'''
+        if self.buf.tell():
+            fimm.Exec(  self.buf.getvalue()  )
+            self.buf = StringIO()
+#end class FimmCommandStream
+
+
 def close_all(warn=True):
     '''Close all open Projects, discarding unsaved changes.
     
@@ -637,6 +672,15 @@ def get_temperature():
 #end get_temperature
 
 
+# Regex patterns for the AMF file header lines, compiled once - see get_amf_data():
+_AMF_NXY_RE = re.compile(  r'\s*(\d+)\s*(\d+)\s*//nxseg nyseg'  )
+_AMF_XY_RE = re.compile(  r'\s*(\d+\.?\d*)\s*(\d+\.?\d*)\s*(\d+\.?\d*)\s*(\d+\.?\d*)\s*//xmin xmax ymin ymax'  )
+_AMF_HAS_RE = re.compile(  r'\s*(\d)\s*(\d)\s*(\d)\s*(\d)\s*(\d)\s*(\d)\s*//hasEX hasEY hasEZ hasHX hasHY hasHZ'  )
+_AMF_BETA_RE = re.compile(  r'\s*(\d+\.?\d*)\s*(\d+\.?\d*)\s*//beta'  )
+_AMF_LAMBDA_RE = re.compile(  r'\s*(\d+\.?\d*)\s*//lambda'  )
+_AMF_ISCOMPLEX_RE = re.compile(  r'\s*(\d)\s*//iscomplex'  )
+_AMF_ISWGMODE_RE = re.compile(  r'\s*(\d)\s*//isWGmode'  )
+
 def get_amf_data(modestring, filename="temp", precision=r"%10.6f", maxbytes=500):
     '''Return the various mode profile data from writing an AMF file.
     This returns data for all field components of a mode profile, the start/end x/y values in microns, number of data points along each axis and some other useful info.
@@ -699,7 +743,6 @@ def get_amf_data(modestring, filename="temp", precision=r"%10.6f", maxbytes=500)
   0 //iscomplex
   1 //isWGmode
     '''
-    import re   # RegEx module
     
     # write an AMF file with all the field components.
     if not filename.endswith(".amf"):  filename += ".amf"   # name of the files
@@ -729,7 +772,7 @@ def get_amf_data(modestring, filename="temp", precision=r"%10.6f", maxbytes=500)
     
     # Set regex pattern to match:
     '''  100 100 //nxseg nyseg'''
-    pat = re.compile(     r'\s*(\d+)\s*(\d+)\s*//nxseg nyseg'  )
+    pat = _AMF_NXY_RE
     m = pat.search(  data_str[s[0]:s[1]]  )      # perform the search
     # m will contain any 'groups' () defined in the RegEx pattern.
     if m:
@@ -741,7 +784,7 @@ def get_amf_data(modestring, filename="temp", precision=r"%10.6f", maxbytes=500)
 
     # Set regex pattern to match:
     '''    0.000000      14.800000       0.000000      12.100000  //xmin xmax ymin ymax'''
-    pat = re.compile(     r'\s*(\d+\.?\d*)\s*(\d+\.?\d*)\s*(\d+\.?\d*)\s*(\d+\.?\d*)\s*//xmin xmax ymin ymax'  )
+    pat = _AMF_XY_RE
     m = pat.search(  data_str[s[0]:s[1]]  )      # perform the search
     # m will contain any 'groups' () defined in the RegEx pattern.
     if m:
@@ -755,7 +798,7 @@ def get_amf_data(modestring, filename="temp", precision=r"%10.6f", maxbytes=500)
 
     # Set regex pattern to match:
     '''  1 1 1 1 1 1 //hasEX hasEY hasEZ hasHX hasHY hasHZ'''
-    pat = re.compile(     r'\s*(\d)\s*(\d)\s*(\d)\s*(\d)\s*(\d)\s*(\d)\s*//hasEX hasEY hasEZ hasHX hasHY hasHZ'  )
+    pat = _AMF_HAS_RE
     m = pat.search(  data_str[s[0]:s[1]]  )      # perform the search
     # m will contain any 'groups' () defined in the RegEx pattern.
     if m:
@@ -772,7 +815,7 @@ def get_amf_data(modestring, filename="temp", precision=r"%10.6f", maxbytes=500)
 
     # Set regex pattern to match:
     '''    6.761841       0.000000  //beta'''
-    pat = re.compile(     r'\s*(\d+\.?\d*)\s*(\d+\.?\d*)\s*//beta'  )
+    pat = _AMF_BETA_RE
     m = pat.search(  data_str[s[0]:s[1]]  )      # perform the search
     # m will contain any 'groups' () defined in the RegEx pattern.
     if m:
@@ -785,7 +828,7 @@ def get_amf_data(modestring, filename="temp", precision=r"%10.6f", maxbytes=500)
 
     # Set regex pattern to match:
     '''    1.550000  //lambda'''
-    pat = re.compile(     r'\s*(\d+\.?\d*)\s*//lambda'  )
+    pat = _AMF_LAMBDA_RE
     m = pat.search(  data_str[s[0]:s[1]]  )      # perform the search
     # m will contain any 'groups' () defined in the RegEx pattern.
     if m:
@@ -797,7 +840,7 @@ def get_amf_data(modestring, filename="temp", precision=r"%10.6f", maxbytes=500)
 
     # Set regex pattern to match:
     '''  0 //iscomplex'''
-    pat = re.compile(     r'\s*(\d)\s*//iscomplex'  )
+    pat = _AMF_ISCOMPLEX_RE
     m = pat.search(  data_str[s[0]:s[1]]  )      # perform the search
     # m will contain any 'groups' () defined in the RegEx pattern.
     if m:
@@ -808,7 +851,7 @@ def get_amf_data(modestring, filename="temp", precision=r"%10.6f", maxbytes=500)
 
     # Set regex pattern to match:
     '''  1 //isWGmode'''
-    pat = re.compile(     r'\s*(\d)\s*//isWGmode'  )
+    pat = _AMF_ISWGMODE_RE
     m = pat.search(  data_str[s[0]:s[1]]  )      # perform the search
     # m will contain any 'groups' () defined in the RegEx pattern.
     if m:
@@ -822,75 +865,6 @@ def get_amf_data(modestring, filename="temp", precision=r"%10.6f", maxbytes=500)
     
     
     return out
-    
-    """
-    # Delete File Header
-    nxy_data = data_list[1]
-    xy_data = data_list[2]
-    slvr_data = data_list[6]
-    del data_list[0:9]
-    
-    # strip the comment lines from the nxy file:
-    nxyFile = os.path.join( AMF_FolderStr(), "mode" + str(num) + "_pyFIMM_nxy.txt")
-    fout = open(nxyFile, "w")
-    fout.writelines(nxy_data)
-    fout.close()
-    nxy = pl.loadtxt(nxyFile, comments='//')
-    nx = int(nxy[0])
-    ny = int(nxy[1])
-    
-    xyFile = os.path.join( AMF_FolderStr(), "mode" + str(num) + "_pyFIMM_xy.txt")
-    fout = open(xyFile, "w")
-    fout.writelines(xy_data)
-    fout.close()
-    xy = pl.loadtxt(xyFile, comments='//')
-    
-    slvrFile = os.path.join( AMF_FolderStr(), "mode" + str(num) + "_pyFIMM_slvr.txt")
-    fout = open(slvrFile, "w")
-    fout.writelines(slvr_data)
-    fout.close()
-    iscomplex = pl.loadtxt(slvrFile, comments='//')
-
-    # Find Field Component
-    if field_cpt_in == None:
-        '''If unspecified, use the component with higher field frac.'''
-        tepercent = fimm.Exec(self.modeString + "list[{" + str(num) + "}].modedata.tefrac")
-        if tepercent > 50:
-            field_cpt = 'Ex'.lower()
-        else:
-            field_cpt = 'Ey'.lower()
-    #end if(field_cpt_in)
-    
-    if field_cpt == 'Ex'.lower():
-        data = data_list[1:nx+2]
-    elif field_cpt == 'Ey'.lower():
-        data = data_list[(nx+2)+1:2*(nx+2)]
-    elif field_cpt == 'Ez'.lower():
-        data = data_list[2*(nx+2)+1:3*(nx+2)]
-    elif field_cpt == 'Hx'.lower():
-        data = data_list[3*(nx+2)+1:4*(nx+2)]
-    elif field_cpt == 'Hy'.lower():
-        data = data_list[4*(nx+2)+1:5*(nx+2)]
-    elif field_cpt == 'Hz'.lower():
-        data = data_list[5*(nx+2)+1:6*(nx+2)]
-    else:
-        ErrStr = 'Invalid Field component requested: ' + str(field_cpt)
-        raise ValueError(ErrStr)
-    
-    del data_list
-    
-    # Resave Files
-    fout = open(mode_FileStr+"_"+field_cpt.strip().lower(), "w")
-    fout.writelines(data)
-    fout.close()
-    
-    # Get Data
-    if iscomplex == 1:
-        field_real = pl.loadtxt(mode_FileStr, usecols=tuple([i for i in range(0,2*ny+1) if i%2==0]))
-        field_imag = pl.loadtxt(mode_FileStr, usecols=tuple([i for i in range(0,2*ny+2) if i%2!=0]))
-    else:
-        field_real = pl.loadtxt(mode_FileStr)
-    """
 
 
 #end get_amf_data()
\ No newline at end of file
@@ -5,6 +5,6 @@ version = "v"+versionnum+", "+versiondate
 
 # if this file called by itself, print the version number:
 if __name__ == "__main__":
-    print version
+    print(version)
 
 